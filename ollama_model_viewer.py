@@ -15,24 +15,476 @@ Features:
 
 import sys
 import os
+import io
 import json
+import re
 import subprocess
 import datetime
 import sqlite3
+import http.client
+from urllib.parse import urlsplit
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import BinaryIO, Dict, List, Optional, Tuple, Set
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import threading
+import queue
 import time
 import hashlib
-import base64
+import tempfile
+from bisect import bisect_right
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 
 # Import the virtual environment manager
-import os
 sys.path.append(os.path.expanduser('~/py-utils'))
 from module_venv import AutoVirtualEnvironment
 
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:  # Installed into the app's venv by main(); copied databases stay unencrypted until then
+    Cipher = None
+
+# Ollama HTTP API (same server the `ollama` CLI talks to)
+OLLAMA_DEFAULT_HOST = '127.0.0.1:11434'
+OLLAMA_API_TIMEOUT = 5  # seconds
+DELETE_WORKERS = 4  # Concurrent `ollama rm` processes when emptying the deletion queue
+DB_CHUNK_BYTES = 1 << 20  # Database encryption streams the file in 1 MiB chunks
+DB_AES_MAGIC = b'OMVAES1\n'  # Header of AES-CTR encrypted databases, followed by the 16-byte nonce
+TEMP_DB_WIPE_BYTES = 4096  # Leading bytes of the decrypted temp database zeroed before removal
+USAGE_DB_MMAP_BYTES = 256 * 1024 * 1024  # SQLite mmap window when reading OpenWebUI usage
+DECRYPT_IN_MEMORY = hasattr(sqlite3.Connection, 'deserialize')  # Python 3.11+; older versions use a temp file
+
+# Treeview windowed rendering: short lists are inserted whole, longer ones a chunk at a time
+TREE_RENDER_THRESHOLD = 100
+TREE_RENDER_CHUNK = 60
+
+# Treeview tag for each age category (row text is tinted with the category colour)
+AGE_TAGS = {
+    'Recently Used': 'age_recent',
+    'Moderately Used': 'age_moderate',
+    'Old Model': 'age_old',
+    'Unknown': 'age_unknown',
+}
+
+# Fonts shared by every widget (built once instead of per widget)
+FONT_FAMILY = 'SF Pro Display'
+FONT_SPACER = (FONT_FAMILY, 6)
+FONT_SMALL = (FONT_FAMILY, 10)
+FONT_BODY = (FONT_FAMILY, 11)
+FONT_BODY_BOLD = (FONT_FAMILY, 11, 'bold')
+FONT_MEDIUM = (FONT_FAMILY, 12)
+FONT_MEDIUM_BOLD = (FONT_FAMILY, 12, 'bold')
+FONT_LARGE = (FONT_FAMILY, 14)
+FONT_LARGE_BOLD = (FONT_FAMILY, 14, 'bold')
+FONT_SUBTITLE = (FONT_FAMILY, 16, 'bold')
+FONT_TITLE = (FONT_FAMILY, 18, 'bold')
+FONT_HEADER = (FONT_FAMILY, 24, 'bold')
+
+# Capability flags, OR-ed into each model's 'cap_mask'
+CAP_TEXT = 1
+CAP_VISION = 2
+CAP_CODE = 4
+CAP_EMBED = 8
+CAP_TOOLS = 16
+CAP_REASONING = 32
+
+# Display label for each capability flag, in column order
+CAPABILITY_LABELS = (
+    (CAP_TEXT, "📝 Text"),
+    (CAP_VISION, "👁️ Vision"),
+    (CAP_CODE, "💻 Code"),
+    (CAP_EMBED, "🔗 Embed"),
+    (CAP_TOOLS, "🛠️ Tools"),
+    (CAP_REASONING, "🧠 Reasoning"),
+)
+
+# Filter flags, OR-ed into each model's 'flags' at load time (see model_flags)
+F_RECENT = 1
+F_MODERATE = 2
+F_OLD = 4
+F_TEXT = 8
+F_VISION = 16
+F_LARGE = 32
+F_SMALL = 64
+F_STARRED = 128
+F_LIBERATED = 256
+F_QUEUED = 512
+F_DUPLICATE = 1024
+F_SPECIAL = 2048
+F_FAMILY = 4096
+F_USED_OWUI = 8192
+F_FREQUENT_OWUI = 16384
+F_HEAVY_OWUI = 32768
+
+# Age category -> filter flag
+AGE_FLAGS = {
+    'Recently Used': F_RECENT,
+    'Moderately Used': F_MODERATE,
+    'Old Model': F_OLD,
+    'Unknown': 0,
+}
+
+# Decimal size units, largest first (the way `ollama list` prints sizes)
+SIZE_UNITS = (('TB', 1000 ** 4), ('GB', 1000 ** 3), ('MB', 1000 ** 2), ('KB', 1000))
+SIZE_SCALES = dict(SIZE_UNITS, B=1)
+
+# "N units ago" wording by days elapsed: bisect_right(AGO_DAY_THRESHOLDS, days) picks the
+# (days per unit, unit) entry of AGO_UNITS; the same-day slot is None (worded in minutes/hours)
+AGO_DAY_THRESHOLDS = (0, 1, 7, 30, 365)
+AGO_UNITS = ((1, 'day'), None, (1, 'day'), (7, 'week'), (30, 'month'), (365, 'year'))
+
+# Separators between the tokens of a model's parameter tag, e.g. '8b-instruct-q4_K_M'
+PARAM_TOKEN_SPLIT = re.compile(r'[-_.:]')
+
+LARGE_MODEL_BYTES = 10 * 1000 ** 3
+SMALL_MODEL_BYTES = 5 * 1000 ** 3
+
+# Filter dropdown entries, in display order
+FILTER_OPTIONS = (
+    'All Models', 'Recently Used (< 2 weeks)',
+    'Moderately Used (2-4 weeks)', 'Old Models (1+ month)',
+    'Text Models', 'Vision Models', 'Large Models (>10GB)',
+    'Small Models (<5GB)', '⭐ Starred Models',
+    '🔓 Liberated Models', '🗑️ Queued for Deletion',
+    '🔄 Duplicate Models', '🔀 Special Variants',
+    '📦 Model Families (2+ models)', '📊 Used in OpenWebUI',
+    '❌ Never Used in OpenWebUI', '🔥 Frequently Used (>10 chats)',
+    '⚡ Recent OpenWebUI Activity',
+)
+
+# Filters whose result can change without a reload, so they are never indexed
+DYNAMIC_FILTERS = {'⭐ Starred Models', '🗑️ Queued for Deletion', '⚡ Recent OpenWebUI Activity'}
+
+# Filters that depend on OpenWebUI usage, re-run when usage arrives after the models
+USAGE_FILTERS = {'📊 Used in OpenWebUI', '❌ Never Used in OpenWebUI',
+                 '🔥 Frequently Used (>10 chats)', '⚡ Recent OpenWebUI Activity'}
+
+# Filter dropdown entries that select models with a single flag set
+FILTER_MASKS = {
+    'Recently Used (< 2 weeks)': F_RECENT,
+    'Moderately Used (2-4 weeks)': F_MODERATE,
+    'Old Models (1+ month)': F_OLD,
+    'Text Models': F_TEXT,
+    'Vision Models': F_VISION,
+    'Large Models (>10GB)': F_LARGE,
+    'Small Models (<5GB)': F_SMALL,
+    '⭐ Starred Models': F_STARRED,
+    '🔓 Liberated Models': F_LIBERATED,
+    '🗑️ Queued for Deletion': F_QUEUED,
+    '🔄 Duplicate Models': F_DUPLICATE,
+    '🔀 Special Variants': F_SPECIAL,
+    '📦 Model Families (2+ models)': F_FAMILY,
+    '📊 Used in OpenWebUI': F_USED_OWUI,
+    '🔥 Frequently Used (>10 chats)': F_FREQUENT_OWUI,
+}
+
+# Filters that can't be expressed as a flag test, called as predicate(model, now)
+FILTER_PREDICATES = {
+    '❌ Never Used in OpenWebUI': lambda model, now: not model['flags'] & F_USED_OWUI,
+    '⚡ Recent OpenWebUI Activity': lambda model, now: (
+        model['last_used_at'] is not None and (now - model['last_used_at']).days <= 7
+    ),
+}
+
+# Sort keys for sortable columns (C-level itemgetter instead of per-compare lambdas)
+SORT_KEYS = {
+    'name': itemgetter('name_lower'),
+    'size': itemgetter('size_bytes'),
+    'modified': itemgetter('days_old_sort'),
+}
+
+# Capability detection patterns (searched in the lowercased model name).
+# Short keywords are guarded against matching inside other words: 'vl'/'vlm' must end
+# the word ('qwen2.5vl', 'internvl', 'cogvlm' yes, 'devlin' no), 'r1' must stand alone
+# ('deepseek-r1' yes, 'fr10' no) and 'code' must not be the tail of 'decoder'.
+CAPABILITY_PATTERNS = (
+    (CAP_VISION, re.compile(r'vision|visual|llava|clip|vlm?(?![a-z])|minicpm-v(?![a-z])')),
+    (CAP_CODE, re.compile(r'(?<!de)code|coding')),
+    (CAP_EMBED, re.compile(r'embed')),
+    (CAP_TOOLS, re.compile(r'tool|function|agent')),
+    (CAP_REASONING, re.compile(r'reasoning|think|(?<![a-z0-9])r1(?![0-9])')),
+)
+
+# Prefixes OpenWebUI may put in front of Ollama model names
+USAGE_NAME_PREFIXES = ('ollama/', 'local/', 'models/')
+
+# Help window text tags: style -> (font, color key in self.colors)
+HELP_STYLES = {
+    'header': (FONT_SUBTITLE, 'accent_blue'),
+    'section': (FONT_MEDIUM_BOLD, 'accent_green'),
+    'space': (FONT_SPACER, 'text_primary'),
+    'text': (FONT_BODY, 'text_primary'),
+}
+
+# Help window lines as (text, style tag)
+HELP_CONTENT = (
+    ("🚀 Ollama Model Viewer Help", 'header'),
+    ("", 'space'),
+    ("⭐ HOW TO STAR A MODEL:", 'section'),
+    ("Method 1: Right-click any model → ⭐ Toggle Star", 'text'),
+    ("Method 2: Select model → Press 's' key", 'text'),
+    ("", 'space'),
+    ("🗑️ HOW TO DELETE MODELS:", 'section'),
+    ("1. Right-click model → 🗑️ Add to Deletion Queue", 'text'),
+    ("2. Click 🗑️ Queue button in header", 'text'),
+    ("3. Review storage estimate and click 🔥 Delete All", 'text'),
+    ("", 'space'),
+    ("⌨️ KEYBOARD SHORTCUTS:", 'section'),
+    ("S = Star/unstar selected model", 'text'),
+    ("D = Add to deletion queue", 'text'),
+    ("R = Remove from deletion queue", 'text'),
+    ("Enter = Show model details", 'text'),
+    ("", 'space'),
+    ("🎯 STATUS ICONS:", 'section'),
+    ("🟢 = Recently used (< 2 weeks)", 'text'),
+    ("🟡 = Moderately used (2-4 weeks)", 'text'),
+    ("🔴 = Old model (1+ month)", 'text'),
+    ("⭐ = Starred/favorite model", 'text'),
+    ("🔓 = Liberated/uncensored model", 'text'),
+    ("🗑️ = Queued for deletion", 'text'),
+    ("🔄 = Duplicate model", 'text'),
+    ("🔀 = Special variant (e.g., -a3b, -instruct)", 'text'),
+    ("💬 = Used in OpenWebUI", 'text'),
+    ("📊 = Frequently used (>10 chats)", 'text'),
+    ("🔥 = Heavily used (>50 chats)", 'text'),
+    ("", 'space'),
+    ("🔍 QUICK FILTERS:", 'section'),
+    ("Use the dropdown to filter by:", 'text'),
+    ("• ⭐ Starred Models", 'text'),
+    ("• 🔓 Liberated Models", 'text'),
+    ("• 🗑️ Queued for Deletion", 'text'),
+    ("• 🔄 Duplicate Models", 'text'),
+    ("• 🔀 Special Variants", 'text'),
+    ("• 📦 Model Families (2+ models)", 'text'),
+    ("• 📊 Used in OpenWebUI", 'text'),
+    ("• ❌ Never Used in OpenWebUI", 'text'),
+    ("• 🔥 Frequently Used (>10 chats)", 'text'),
+    ("• ⚡ Recent OpenWebUI Activity", 'text'),
+    ("• Size, age, capabilities, etc.", 'text'),
+    ("", 'space'),
+    ("📊 OPENWEBUI INTEGRATION:", 'section'),
+    ("Automatically detects OpenWebUI database", 'text'),
+    ("Shows actual usage stats from chat history", 'text'),
+    ("Track which models you really use", 'text'),
+    ("Filter by usage patterns to find unused models", 'text'),
+    ("", 'space'),
+    ("💾 STORAGE INFO:", 'section'),
+    ("💾 Storage usage shown in status bar", 'text'),
+    ("Duplicate detection helps identify space savings", 'text'),
+    ("Special variants (-a3b, -instruct) are preserved", 'text'),
+    ("Usage data helps identify models safe to delete", 'text'),
+    ("", 'space'),
+    ("🔒 PRIVACY & SECURITY:", 'section'),
+    ("OpenWebUI database automatically encrypted (AES-256)" if Cipher is not None
+     else "Database encryption needs the cryptography package", 'text'),
+    ("Only usage statistics accessed (no chat content)", 'text'),
+    ("All processing happens locally on your machine", 'text'),
+    ("Decrypted database is only read in memory" if DECRYPT_IN_MEMORY
+     else "Decrypted database is read from a temp file, wiped right after", 'text'),
+    ("", 'space'),
+    ("🗺️ FUTURE ROADMAP:", 'section'),
+    ("(These features are currently disabled for privacy)", 'text'),
+    ("📚 Chat browsing and search functionality", 'text'),
+    ("📊 Conversation topic analysis", 'text'),
+    ("📋 Export conversations and knowledge", 'text'),
+    ("💾 Personal AI knowledge base creation", 'text'),
+    ("🔍 Advanced usage analytics", 'text'),
+)
+
+# Directories that may hold OpenWebUI's webui.db, most likely first (one isfile() each, on every platform)
+_HOME = os.path.expanduser('~')
+OPENWEBUI_DATA_DIRS = (
+    # Temporary copy location
+    os.path.join(_HOME, 'tmp', 'openwebui'),
+    # Docker volume mounts
+    os.path.join(_HOME, 'openwebui'),
+    os.path.join(_HOME, 'open-webui'),
+    os.path.join(_HOME, 'open_webui'),
+    # Default Docker locations
+    '/app/backend/data',
+    '/data',
+    # Local installations
+    os.path.join(_HOME, '.config', 'open-webui'),
+    os.path.join(_HOME, '.local', 'share', 'open-webui'),
+    # Common container mount points
+    '/opt/open-webui/data',
+    '/var/lib/open-webui',
+)
+# Roots of the (much more expensive) directory walk. /opt and /var/lib are only walked on
+# Linux; on macOS /opt is mostly Homebrew's large tree and /var/lib is rarely used
+OPENWEBUI_SEARCH_ROOTS = (_HOME, '/opt', '/var/lib') if sys.platform.startswith('linux') else (_HOME,)
+OPENWEBUI_DB_CANDIDATES = tuple(os.path.join(directory, 'webui.db') for directory in OPENWEBUI_DATA_DIRS)
+
+# Last-resort webui.db search: how deep to look and which (large, irrelevant) directories to skip
+WEBUI_SEARCH_DEPTH = 4
+WEBUI_SEARCH_SKIP = frozenset({
+    'node_modules', 'Library', '.cache', '.cargo', '.rustup', '.npm',
+    '.venv', 'venv', '.git', '.Trash',
+})
+
+
+@lru_cache(maxsize=1024)
+def _capabilities_for(name_lower: str) -> Tuple[str, int]:
+    """Capability label and CAP_* bitmask for a lowercased model name (memoized)."""
+    # Text capabilities (all models have this)
+    mask = CAP_TEXT
+    
+    # Vision, code, embedding, tool use and reasoning capabilities
+    for flag, pattern in CAPABILITY_PATTERNS:
+        if pattern.search(name_lower):
+            mask |= flag
+    
+    return " ".join(label for flag, label in CAPABILITY_LABELS if mask & flag), mask
+
+
+@lru_cache(maxsize=256)
+def _days_old_for(modified_lower: str) -> Optional[int]:
+    """Whole days for a lowercased relative time like '3 weeks ago' (memoized)."""
+    parts = modified_lower.split()
+    # Skip a leading "about" ("About an hour ago")
+    if parts and parts[0] == 'about':
+        parts = parts[1:]
+    if len(parts) < 2:
+        return None
+    
+    if parts[0] in ('a', 'an'):
+        amount = 1
+    elif parts[0].isdigit():
+        amount = int(parts[0])
+    elif parts[0] == 'less':
+        return 0  # "Less than a second ago"
+    else:
+        return None
+    
+    unit = parts[1]
+    if unit.startswith(('second', 'minute', 'hour')):
+        return 0
+    elif unit.startswith('day'):
+        return amount
+    elif unit.startswith('week'):
+        return amount * 7
+    elif unit.startswith('month'):
+        return amount * 30
+    elif unit.startswith('year'):
+        return amount * 365
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _days_ago_text(days: int) -> str:
+    """'3 weeks ago' style text for a non-zero number of elapsed days (memoized)."""
+    per_unit, unit = AGO_UNITS[bisect_right(AGO_DAY_THRESHOLDS, days)]
+    amount = days // per_unit
+    return f"{amount} {unit}{'' if amount == 1 else 's'} ago"
+
+
+@lru_cache(maxsize=512)
+def _clean_name_for(model_name: str) -> str:
+    """Lowercased model name without OpenWebUI prefixes (memoized)."""
+    clean_name = model_name.lower().strip()
+    for prefix in USAGE_NAME_PREFIXES:
+        if clean_name.startswith(prefix):
+            clean_name = clean_name[len(prefix):]
+    return clean_name
+
+
+@lru_cache(maxsize=None)
+def _status_icons_for(flags: int) -> str:
+    """Status column icons for a combination of F_* flags."""
+    # Age indicator first
+    if flags & F_RECENT:
+        icons = ["🟢"]
+    elif flags & F_MODERATE:
+        icons = ["🟡"]
+    else:
+        icons = ["🔴"]
+    
+    # Special status indicators
+    if flags & F_STARRED:
+        icons.append("⭐")
+    if flags & F_LIBERATED:
+        icons.append("🔓")
+    if flags & F_QUEUED:
+        icons.append("🗑️")
+    if flags & F_DUPLICATE:
+        icons.append("🔄")  # Duplicate indicator
+    elif flags & F_FAMILY and flags & F_SPECIAL:
+        icons.append("🔀")  # Special variant indicator
+    
+    # OpenWebUI usage indicators
+    if flags & F_HEAVY_OWUI:
+        icons.append("🔥")  # Heavily used
+    elif flags & F_FREQUENT_OWUI:
+        icons.append("📊")  # Frequently used
+    elif flags & F_USED_OWUI:
+        icons.append("💬")  # Used
+    return "".join(icons)
+
+
+def _find_webui_db(root: Path, max_depth: int = WEBUI_SEARCH_DEPTH) -> Optional[Path]:
+    """Breadth-first search for webui.db under root, skipping WEBUI_SEARCH_SKIP directories."""
+    pending = deque([(str(root), 0)])
+    while pending:
+        directory, depth = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == 'webui.db' and entry.is_file():
+                        return Path(entry.path)
+                    if (depth < max_depth and entry.name not in WEBUI_SEARCH_SKIP
+                            and entry.is_dir(follow_symlinks=False)):
+                        pending.append((entry.path, depth + 1))
+        except OSError:
+            continue  # Unreadable directory
+    return None
+
+
+def _file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents, read one chunk at a time."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DB_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _xor_stream(src: BinaryIO, dst: BinaryIO, key: bytes):
+    """XOR src with a repeating key into dst, one chunk at a time."""
+    # Chunks are a whole number of key lengths so every chunk starts at key offset 0
+    chunk_size = DB_CHUNK_BYTES - DB_CHUNK_BYTES % len(key)
+    keystream = key * (chunk_size // len(key))
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        # Big-int XOR runs in C rather than a per-byte generator
+        size = len(chunk)
+        mixed = int.from_bytes(chunk, 'little') ^ int.from_bytes(keystream[:size], 'little')
+        dst.write(mixed.to_bytes(size, 'little'))
+
+
+def _aes_ctr_stream(src: BinaryIO, dst: BinaryIO, key: bytes, decrypt: bool = False):
+    """AES-256-CTR src into dst; encrypted data starts with DB_AES_MAGIC and the nonce."""
+    if decrypt:
+        src.read(len(DB_AES_MAGIC))
+        nonce = src.read(16)
+    else:
+        nonce = os.urandom(16)
+        dst.write(DB_AES_MAGIC + nonce)
+    # CTR mode is symmetric, so the same keystream both encrypts and decrypts
+    context = Cipher(algorithms.AES(key), modes.CTR(nonce)).encryptor()
+    while True:
+        chunk = src.read(DB_CHUNK_BYTES)
+        if not chunk:
+            break
+        dst.write(context.update(chunk))
+    dst.write(context.finalize())
+
+
 class OllamaModelViewer:
     """Main application class for the Ollama Model Viewer."""
     
@@ -41,20 +493,46 @@ class OllamaModelViewer:
         self.root = tk.Tk()
         self.models_data = []
         self.filtered_models = []
+        self._models_by_name: Dict[str, Dict] = {}  # Model name -> entry of models_data
         self.current_sort = "name"
         self.sort_reverse = False
         self.search_var = tk.StringVar()
         self.filter_var = tk.StringVar()
+        self.status_var = tk.StringVar(value="Ready")
+        self._filter_job = None  # Pending debounced apply_filters() call
+        self._row_cache: Dict[str, Tuple] = {}  # Treeview iid (model name) -> (values, tags) last written
+        self._filter_index: Dict[str, List[Dict]] = {}  # Filter name -> matching models, rebuilt on load
+        self._rendered_limit = 0  # Rows of filtered_models currently materialized in the tree
+        self._render_more_job = None  # Pending idle call that extends the rendered window
+        self._populate_job = None  # Pending idle populate_tree() from schedule_populate()
+        self._detail_windows: Dict[str, tk.Toplevel] = {}  # Model name -> hidden/visible details window
+        self._help_window: Optional[tk.Toplevel] = None  # Built on first open, then hidden/shown
+        self._fonts: Dict[Tuple, tkfont.Font] = {}  # FONT_* spec -> shared Font, see named_font()
         
         # New features
         self.deletion_queue: Set[str] = set()  # Models queued for deletion
+        self._queue_bytes = 0  # Total size of the queued models, kept up to date on every change
+        self._sorted_queue: Optional[List[str]] = None  # sorted(deletion_queue), dropped on every change
         self.starred_models: Set[str] = set()  # Starred/favorite models
-        self.config_file = Path.home() / '.ollama_model_viewer_config.json'
+        self.config_db = Path.home() / '.ollama_model_viewer.db'
+        self.config_file = Path.home() / '.ollama_model_viewer_config.json'  # Legacy JSON config, migrated once
+        self._config_conn: Optional[sqlite3.Connection] = None  # Open config database
+        self._ollama_conn: Optional[http.client.HTTPConnection] = None  # Kept alive across refreshes
+        self._loading = False  # True while a background load_models() is in flight
+        self._models_version = 0  # Bumped whenever models_data is replaced
+        self._storage_cache = (None, "")  # (models version, total storage text)
+        self._sorted_cache: Dict[Tuple[str, bool], List[Dict]] = {}  # (column, reverse) -> sorted models_data
         
         # OpenWebUI Integration
         self.openwebui_data_path = None  # Will be detected automatically
         self.openwebui_usage_data = {}  # Cache for model usage from OpenWebUI
-        self.detect_openwebui_path()  # Automatically detect OpenWebUI installation
+        self._usage_data_loaded = False  # Cleared by each reload so usage is re-read
+        self._usage_merge_running = False  # Usage is being read for models shown without it
+        self._usage_lock = threading.Lock()  # One usage read at a time (shared cache file and temp DB)
+        self.usage_cache_file = Path.home() / '.cache' / 'ollama-model-viewer' / 'usage.json'  # Keyed by database mtime/size or hash, mode 0600
+        self._openwebui_source_hash = None  # SHA-256 of a Docker-copied database, taken before it is encrypted
+        self._openwebui_detected = threading.Event()  # Set once background detection has finished
+        self._privacy_notice_pending = False  # Set by detection when a Docker copy was made
         
         # Privacy & Security Settings
         self.privacy_mode = True  # Enable privacy protection by default
@@ -62,6 +540,9 @@ class OllamaModelViewer:
         self.enable_chat_features = False  # Disable chat browsing by default (future roadmap)
         self.database_key = None  # Will be generated if encryption enabled
         
+        # Automatically detect OpenWebUI installation (docker and the filesystem search run off the UI thread)
+        self.start_openwebui_detection()
+        
         # Liberation detection keywords
         self.liberation_keywords = [
             'uncensored', 'abliterated', 'art', 'unfiltered', 'raw', 
@@ -76,6 +557,11 @@ class OllamaModelViewer:
             'reasoning', 'uncensored', 'abliterated', 'art', 'base'
         ]
         
+        # Liberation keywords can appear anywhere in a name, so they're compiled into one
+        # alternation; special suffixes are whole tags ('8b-instruct-q4_0'), so a set lookup per token
+        self._liberation_re = re.compile('|'.join(map(re.escape, self.liberation_keywords)), re.IGNORECASE)
+        self._special_suffix_set = frozenset(self.special_suffixes)
+        
         # Load saved configuration
         self.load_config()
         
@@ -140,45 +626,52 @@ class OllamaModelViewer:
         """Configure ttk styles for consistent theming."""
         style = ttk.Style()
         
-        # Configure treeview style
-        style.theme_use('clam')
-        
-        style.configure('Custom.Treeview',
-                       background=self.colors['bg_tertiary'],
-                       foreground=self.colors['text_primary'],
-                       fieldbackground=self.colors['bg_tertiary'],
-                       borderwidth=0,
-                       font=('SF Pro Display', 11))
-        
-        style.configure('Custom.Treeview.Heading',
-                       background=self.colors['bg_secondary'],
-                       foreground=self.colors['text_primary'],
-                       font=('SF Pro Display', 12, 'bold'))
-        
-        # Configure other styles
-        style.configure('Custom.TFrame',
-                       background=self.colors['bg_primary'])
-        
-        style.configure('Custom.TLabel',
-                       background=self.colors['bg_primary'],
-                       foreground=self.colors['text_primary'],
-                       font=('SF Pro Display', 11))
-        
-        style.configure('Header.TLabel',
-                       background=self.colors['bg_primary'],
-                       foreground=self.colors['accent_blue'],
-                       font=('SF Pro Display', 24, 'bold'))
-        
-        style.configure('Custom.TEntry',
-                       fieldbackground=self.colors['bg_tertiary'],
-                       foreground=self.colors['text_primary'],
-                       borderwidth=1,
-                       insertcolor=self.colors['text_primary'])
-        
-        style.configure('Custom.TCombobox',
-                       fieldbackground=self.colors['bg_tertiary'],
-                       foreground=self.colors['text_primary'],
-                       borderwidth=1)
+        style_specs = {
+            'Custom.Treeview': {
+                'background': self.colors['bg_tertiary'],
+                'foreground': self.colors['text_primary'],
+                'fieldbackground': self.colors['bg_tertiary'],
+                'borderwidth': 0,
+                'font': FONT_BODY,
+            },
+            'Custom.Treeview.Heading': {
+                'background': self.colors['bg_secondary'],
+                'foreground': self.colors['text_primary'],
+                'font': FONT_MEDIUM_BOLD,
+            },
+            'Custom.TFrame': {
+                'background': self.colors['bg_primary'],
+            },
+            'Custom.TLabel': {
+                'background': self.colors['bg_primary'],
+                'foreground': self.colors['text_primary'],
+                'font': FONT_BODY,
+            },
+            'Header.TLabel': {
+                'background': self.colors['bg_primary'],
+                'foreground': self.colors['accent_blue'],
+                'font': FONT_HEADER,
+            },
+            'Custom.TEntry': {
+                'fieldbackground': self.colors['bg_tertiary'],
+                'foreground': self.colors['text_primary'],
+                'borderwidth': 1,
+                'insertcolor': self.colors['text_primary'],
+            },
+            'Custom.TCombobox': {
+                'fieldbackground': self.colors['bg_tertiary'],
+                'foreground': self.colors['text_primary'],
+                'borderwidth': 1,
+            },
+        }
+        
+        # Install every style with one theme definition (derived from 'clam') instead of
+        # a separate style.configure() round-trip per style
+        if 'ollama_dark' not in style.theme_names():
+            style.theme_create('ollama_dark', parent='clam', settings={
+                style_name: {'configure': options} for style_name, options in style_specs.items()
+            })
+        style.theme_use('ollama_dark')
         
     def create_header(self):
         """Create the application header."""
@@ -201,7 +694,7 @@ class OllamaModelViewer:
                                   command=self.show_deletion_queue,
                                   bg=self.colors['warning'],
                                   fg=self.colors['bg_primary'],
-                                  font=('SF Pro Display', 11, 'bold'),
+                                  font=FONT_BODY_BOLD,
                                   relief='flat',
                                   padx=15,
                                   pady=6,
@@ -214,7 +707,7 @@ class OllamaModelViewer:
                                command=self.refresh_models,
                                bg=self.colors['accent_blue'],
                                fg=self.colors['bg_primary'],
-                               font=('SF Pro Display', 12, 'bold'),
+                               font=FONT_MEDIUM_BOLD,
                                relief='flat',
                                padx=20,
                                pady=8,
@@ -227,7 +720,7 @@ class OllamaModelViewer:
                             command=self.show_help,
                             bg=self.colors['accent_purple'],
                             fg=self.colors['bg_primary'],
-                            font=('SF Pro Display', 11, 'bold'),
+                            font=FONT_BODY_BOLD,
                             relief='flat',
                             padx=15,
                             pady=6,
@@ -249,7 +742,7 @@ class OllamaModelViewer:
         search_entry = ttk.Entry(search_frame, 
                                 textvariable=self.search_var,
                                 style='Custom.TEntry',
-                                font=('SF Pro Display', 11),
+                                font=FONT_BODY,
                                 width=30)
         search_entry.pack(side='left', padx=(0, 20))
         
@@ -260,15 +753,7 @@ class OllamaModelViewer:
         filter_combo = ttk.Combobox(toolbar_frame,
                                    textvariable=self.filter_var,
                                    style='Custom.TCombobox',
-                                   values=['All Models', 'Recently Used (< 2 weeks)', 
-                                          'Moderately Used (2-4 weeks)', 'Old Models (1+ month)',
-                                          'Text Models', 'Vision Models', 'Large Models (>10GB)',
-                                          'Small Models (<5GB)', '⭐ Starred Models', 
-                                          '🔓 Liberated Models', '🗑️ Queued for Deletion',
-                                          '🔄 Duplicate Models', '🔀 Special Variants',
-                                          '📦 Model Families (2+ models)', '📊 Used in OpenWebUI',
-                                          '❌ Never Used in OpenWebUI', '🔥 Frequently Used (>10 chats)',
-                                          '⚡ Recent OpenWebUI Activity'],
+                                   values=FILTER_OPTIONS,
                                    state='readonly',
                                    width=25)
         filter_combo.set('All Models')
@@ -319,15 +804,24 @@ class OllamaModelViewer:
         self.tree.column('id', width=200, minwidth=150)
         
         # Create scrollbars
-        v_scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.tree.yview)
+        self.v_scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(list_frame, orient='horizontal', command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(yscrollcommand=self.on_tree_yscroll, xscrollcommand=h_scrollbar.set)
         
         # Pack treeview and scrollbars
         self.tree.pack(side='left', fill='both', expand=True)
-        v_scrollbar.pack(side='right', fill='y')
+        self.v_scrollbar.pack(side='right', fill='y')
         h_scrollbar.pack(side='bottom', fill='x')
         
+        # Configure tag colors once; rows reference them by name at insert time
+        # (removed liberated tag since we're not highlighting those rows anymore)
+        self.tree.tag_configure('deletion', background=self.colors['deletion'], foreground='white')
+        self.tree.tag_configure('starred', background=self.colors['accent_pink'], foreground=self.colors['bg_primary'])
+        self.tree.tag_configure('age_recent', foreground=self.colors['accent_green'])
+        self.tree.tag_configure('age_moderate', foreground=self.colors['accent_yellow'])
+        self.tree.tag_configure('age_old', foreground=self.colors['accent_red'])
+        self.tree.tag_configure('age_unknown', foreground=self.colors['text_secondary'])
+        
         # Bind double-click event
         self.tree.bind('<Double-1>', self.on_model_double_click)
         
@@ -352,7 +846,7 @@ class OllamaModelViewer:
         status_frame.pack(fill='x', padx=20, pady=(0, 20))
         
         self.status_label = ttk.Label(status_frame, 
-                                     text="Ready", 
+                                     textvariable=self.status_var, 
                                      style='Custom.TLabel')
         self.status_label.pack(side='left')
         
@@ -360,7 +854,7 @@ class OllamaModelViewer:
         self.storage_label = ttk.Label(status_frame,
                                       text="💾 Calculating storage...",
                                       style='Custom.TLabel',
-                                      font=('SF Pro Display', 11, 'bold'))
+                                      font=FONT_BODY_BOLD)
         self.storage_label.pack(side='right', padx=(0, 20))
         
         # Model count label
@@ -370,31 +864,167 @@ class OllamaModelViewer:
         self.count_label.pack(side='right')
         
     def load_models(self):
-        """Load Ollama models data."""
+        """Load Ollama models data on a background thread so the UI stays responsive."""
+        if self._loading:
+            return
+        self._loading = True
+        self._usage_data_loaded = False  # Pick up chats made since the last load
         self.update_status("🔄 Loading models...")
         
+        # Tk is not thread-safe: the worker only hands results back through this queue,
+        # which the main thread polls with after(). It gets copies of the sets the UI edits
+        result_queue = queue.Queue(maxsize=1)
+        snapshot = (frozenset(self.starred_models), frozenset(self.deletion_queue))
+        threading.Thread(target=self._load_models_worker, args=(result_queue, *snapshot), daemon=True).start()
+        self.root.after(50, self._poll_load_result, result_queue)
+    
+    def _load_models_worker(self, result_queue: queue.Queue, starred_models: Set[str], deletion_queue: Set[str]):
+        """Fetch and parse models off the UI thread."""
         try:
-            # Run ollama list command
-            result = subprocess.run(['ollama', 'list'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  check=True)
+            try:
+                entries = self.fetch_models_from_api()
+            except (OSError, http.client.HTTPException, ValueError, KeyError):
+                # API unreachable - fall back to the CLI
+                result = subprocess.run(['ollama', 'list'], 
+                                      capture_output=True, 
+                                      text=True, 
+                                      check=True)
+                entries = self.parse_ollama_output(result.stdout)
             
-            self.models_data = self.parse_ollama_output(result.stdout)
-            self.filtered_models = self.models_data.copy()
-            self.populate_tree()
-            self.update_status(f"✅ Loaded {len(self.models_data)} models")
+            result_queue.put(('ok', self.build_models_data(entries, starred_models, deletion_queue)))
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            result_queue.put(('unavailable', e))
+        except Exception as e:
+            result_queue.put(('error', e))
+    
+    def _poll_load_result(self, result_queue: queue.Queue):
+        """Apply the background load result once it is ready."""
+        try:
+            outcome, payload = result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_load_result, result_queue)
+            return
+        
+        self._loading = False
+        if outcome == 'ok':
+            self._apply_loaded_models(payload)
+        elif outcome == 'unavailable':
             self.update_status("❌ Error: Ollama not found or not running")
             messagebox.showerror("Error", "Could not connect to Ollama. Please ensure Ollama is installed and running.")
-        except Exception as e:
-            self.update_status(f"❌ Error: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+        else:
+            self.update_status(f"❌ Error: {str(payload)}")
+            messagebox.showerror("Error", f"An error occurred: {str(payload)}")
+    
+    def _apply_loaded_models(self, models: List[Dict]):
+        """Install freshly loaded model data and refresh the view."""
+        self.models_data = models
+        self._models_by_name = {model['name']: model for model in models}
+        self._queue_bytes = sum(self._models_by_name[name]['size_bytes']
+                                for name in self.deletion_queue if name in self._models_by_name)
+        self._models_version += 1
+        self._sorted_cache.clear()
+        self.close_detail_windows()  # Cached details may describe stale data
+        self.build_filter_index()
+        self.filtered_models = self.models_data.copy()
+        self.populate_tree(reset_window=True)
+        self.update_status(f"✅ Loaded {len(self.models_data)} models")
+        self.merge_usage_data()  # In case OpenWebUI detection finished while these loaded
+    
+    def get_ollama_address(self) -> Tuple[str, int]:
+        """Resolve the Ollama server address, honouring OLLAMA_HOST like the CLI does."""
+        host = os.environ.get('OLLAMA_HOST') or OLLAMA_DEFAULT_HOST
+        parsed = urlsplit(host if '://' in host else f"http://{host}")
+        hostname = parsed.hostname or '127.0.0.1'
+        if hostname == '0.0.0.0':
+            hostname = '127.0.0.1'
+        return hostname, parsed.port or 11434
+    
+    def fetch_models_from_api(self) -> List[Dict]:
+        """Fetch installed models from the Ollama HTTP API (GET /api/tags)."""
+        for attempt in range(2):
+            if self._ollama_conn is None:
+                hostname, port = self.get_ollama_address()
+                self._ollama_conn = http.client.HTTPConnection(hostname, port, timeout=OLLAMA_API_TIMEOUT)
+            try:
+                self._ollama_conn.request('GET', '/api/tags')
+                response = self._ollama_conn.getresponse()
+                body = response.read()
+                if response.status != 200:
+                    raise http.client.HTTPException(f"Ollama API returned HTTP {response.status}")
+                break
+            except (OSError, http.client.HTTPException):
+                # Drop the connection; retry once in case the server closed the keep-alive
+                self._ollama_conn.close()
+                self._ollama_conn = None
+                if attempt:
+                    raise
+        
+        entries = []
+        now = datetime.datetime.now()
+        for model in json.loads(body)['models']:
+            modified_at = self.parse_timestamp(model.get('modified_at'))
+            entries.append({
+                'name': model['name'],
+                'id': model.get('digest', '')[:12],
+                'size': self.format_size(model.get('size', 0)),
+                'size_bytes': model.get('size', 0),
+                'modified': self.format_time_ago(modified_at, now) if modified_at else "Unknown",
+                'days_old': max((now - modified_at).days, 0) if modified_at else None
+            })
+        return entries
+    
+    def parse_timestamp(self, value: Optional[str]) -> Optional[datetime.datetime]:
+        """Parse an RFC 3339 timestamp from the Ollama API into a naive local datetime."""
+        if not value:
+            return None
+        # fromisoformat() on older Pythons only accepts 'Z'-less, microsecond precision input
+        value = re.sub(r'(\.\d{6})\d+', r'\1', value.replace('Z', '+00:00'))
+        try:
+            parsed = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+    
+    def parse_usage_time(self, value) -> Optional[datetime.datetime]:
+        """Parse an OpenWebUI timestamp (Unix seconds or an ISO string) into a naive local datetime."""
+        if isinstance(value, (int, float)):
+            try:
+                return datetime.datetime.fromtimestamp(value)
+            except (OverflowError, OSError, ValueError):
+                return None
+        if isinstance(value, str):
+            return self.parse_timestamp(value)
+        return None
+    
+    def format_size(self, size_bytes: int) -> str:
+        """Format a byte count the way `ollama list` does (decimal units)."""
+        for unit, scale in SIZE_UNITS:
+            if size_bytes >= scale:
+                value = size_bytes / scale
+                return f"{value:.1f} {unit}" if value < 10 else f"{value:.0f} {unit}"
+        return f"{size_bytes} B"
+    
+    def format_storage(self, total_bytes: int) -> Tuple[float, str]:
+        """Express a storage total in its largest unit (KB at minimum), with one decimal."""
+        for unit, scale in SIZE_UNITS:
+            if total_bytes >= scale or unit == 'KB':
+                value = total_bytes / scale
+                return value, f"{value:.1f} {unit}"
+    
+    def parse_size(self, size_str: str) -> int:
+        """Parse a display size like '4.7 GB' back into bytes (decimal units, as Ollama prints them)."""
+        try:
+            value, unit = size_str.split()[:2]
+            return int(float(value) * SIZE_SCALES[unit.upper()])
+        except (ValueError, KeyError):
+            return 0
     
     def parse_ollama_output(self, output: str) -> List[Dict]:
-        """Parse the output from 'ollama list' command."""
-        models = []
+        """Parse the output from 'ollama list' command into raw model entries."""
+        entries = []
         lines = output.strip().split('\n')[1:]  # Skip header
         
         for line in lines:
@@ -407,187 +1037,220 @@ class OllamaModelViewer:
                 model_id = parts[1]
                 size = parts[2] + " " + parts[3]
                 modified = " ".join(parts[4:])
-                
-                # Determine age category and color
-                age_category, color = self.get_age_category(modified)
-                
-                # Determine capabilities based on model name
-                capabilities = self.determine_capabilities(name)
-                
-                # Check if model is liberated/uncensored
-                is_liberated = self.is_liberated_model(name)
-                
-                # Check if model is starred
-                is_starred = name in self.starred_models
-                
-                # Check if model is queued for deletion
-                is_queued_for_deletion = name in self.deletion_queue
-                
-                # Get OpenWebUI usage data for this model
-                usage_info = self.get_model_usage_info(name)
-                
-                model_data = {
+                entries.append({
                     'name': name,
                     'id': model_id,
                     'size': size,
+                    'size_bytes': self.parse_size(size),
                     'modified': modified,
-                    'age_category': age_category,
-                    'color': color,
-                    'capabilities': capabilities,
-                    'status': self.get_model_status(name),
-                    'is_liberated': is_liberated,
-                    'is_starred': is_starred,
-                    'is_queued_for_deletion': is_queued_for_deletion,
-                    'usage_info': usage_info  # Add OpenWebUI usage data
-                }
-                
-                models.append(model_data)
+                    'days_old': self.parse_days_old(modified)
+                })
+        
+        return entries
+    
+    def build_models_data(self, entries: List[Dict], starred_models: Optional[Set[str]] = None,
+                          deletion_queue: Optional[Set[str]] = None) -> List[Dict]:
+        """Build the per-model data dicts used by the UI from raw model entries.
+        
+        Background callers pass snapshots of the starred and queued sets; the defaults
+        read the live sets, which is only safe on the UI thread.
+        """
+        if starred_models is None:
+            starred_models = self.starred_models
+        if deletion_queue is None:
+            deletion_queue = self.deletion_queue
+        models = []
+        
+        # Usage for every model comes from one OpenWebUI query, loaded before the loop
+        self.load_usage_data()
+        
+        for position, entry in enumerate(entries):
+            name = entry['name']
+            
+            # Determine age category and color
+            age_category, color = self.get_age_category(entry['days_old'])
+            
+            # Determine capabilities based on model name
+            capabilities, cap_mask = self.determine_capabilities(name)
+            
+            # Check if model is liberated/uncensored
+            is_liberated = self.is_liberated_model(name)
+            
+            # Check if model is starred
+            is_starred = name in starred_models
+            
+            # Check if model is queued for deletion
+            is_queued_for_deletion = name in deletion_queue
+            
+            # Get OpenWebUI usage data for this model
+            usage_info = self.get_model_usage_info(name)
+            
+            # Family name and parameter tag, e.g. 'llama3' and '8b-instruct'
+            base_name, _, params = name.lower().partition(':')
+            
+            model_data = {
+                'name': name,
+                'name_lower': name.lower(),
+                'position': position,  # Load order, used to keep subsets in list order
+                'base_name': base_name,
+                'params': params,
+                'is_special_variant': self.has_special_suffix(params),
+                'id': entry['id'],
+                'size': entry['size'],
+                'size_bytes': entry['size_bytes'],
+                'modified': entry['modified'],
+                'days_old': entry['days_old'],
+                'days_old_sort': entry['days_old'] if entry['days_old'] is not None else sys.maxsize,  # Unknown ages sort last
+                'age_category': age_category,
+                'color': color,
+                'age_tag': AGE_TAGS[age_category],
+                'capabilities': capabilities,
+                'cap_mask': cap_mask,
+                'status': self.get_model_status(name),
+                'is_liberated': is_liberated,
+                'is_starred': is_starred,
+                'is_queued_for_deletion': is_queued_for_deletion,
+                'usage_info': usage_info,  # Add OpenWebUI usage data
+                'last_used_at': self.parse_usage_time(usage_info.get('last_used')) if usage_info else None
+            }
+            
+            # Tree columns after the status icons never change between refreshes
+            model_data['row_values'] = (
+                name,
+                model_data['size'],
+                model_data['modified'],
+                capabilities,
+                model_data['status'],
+                entry['id'][:12] + "..."  # Truncate ID for display
+            )
+            
+            models.append(model_data)
         
         # Detect duplicates and variants after all models are parsed
-        duplicates, variants = self.detect_duplicates()
+        duplicates, variants = self.detect_duplicates(models)
         
         # Add duplicate/variant information to model data
         for model in models:
             model['is_duplicate'] = model['name'] in duplicates
-            base_name = self.get_model_base_name(model['name'])
-            model['variant_info'] = variants.get(base_name, None)
-            model['is_special_variant'] = self.is_special_variant(model['name'])
+            model['variant_info'] = variants.get(model['base_name'])
+            model['flags'] = self.model_flags(model)
         
         return models
     
-    def get_age_category(self, modified_str: str) -> Tuple[str, str]:
-        """Determine the age category and color for a model based on last modified time."""
-        try:
-            # Parse the modified string to determine age
-            if 'day' in modified_str:
-                days = int(modified_str.split()[0])
-                if days <= 14:
-                    return "Recently Used", self.colors['accent_green']
-                elif days <= 28:
-                    return "Moderately Used", self.colors['accent_yellow']
-                else:
-                    return "Old Model", self.colors['accent_red']
-            elif 'week' in modified_str:
-                weeks = int(modified_str.split()[0])
-                if weeks <= 2:
-                    return "Recently Used", self.colors['accent_green']
-                elif weeks <= 4:
-                    return "Moderately Used", self.colors['accent_yellow']
-                else:
-                    return "Old Model", self.colors['accent_red']
-            elif 'month' in modified_str:
-                return "Old Model", self.colors['accent_red']
-            else:
-                # Default for unclear time formats
-                return "Unknown", self.colors['text_secondary']
-        except:
-            return "Unknown", self.colors['text_secondary']
+    def model_flags(self, model: Dict) -> int:
+        """Pack a model's filterable properties into F_* flag bits."""
+        flags = AGE_FLAGS[model['age_category']]
+        if model['cap_mask'] & CAP_TEXT:
+            flags |= F_TEXT
+        if model['cap_mask'] & CAP_VISION:
+            flags |= F_VISION
+        if model['size_bytes'] > LARGE_MODEL_BYTES:
+            flags |= F_LARGE
+        elif model['size_bytes'] < SMALL_MODEL_BYTES:
+            flags |= F_SMALL
+        if model['is_starred']:
+            flags |= F_STARRED
+        if model['is_liberated']:
+            flags |= F_LIBERATED
+        if model['is_queued_for_deletion']:
+            flags |= F_QUEUED
+        if model['is_duplicate']:
+            flags |= F_DUPLICATE
+        if model['is_special_variant']:
+            flags |= F_SPECIAL
+        if model['variant_info']:
+            flags |= F_FAMILY
+        
+        usage_count = model['usage_info'].get('usage_count', 0) if model['usage_info'] else 0
+        if usage_count > 0:
+            flags |= F_USED_OWUI
+        if usage_count > 10:
+            flags |= F_FREQUENT_OWUI
+        if usage_count > 50:
+            flags |= F_HEAVY_OWUI
+        return flags
     
-    def determine_capabilities(self, model_name: str) -> str:
-        """Determine model capabilities based on the model name."""
-        capabilities = []
-        
-        # Text capabilities (all models have this)
-        capabilities.append("📝 Text")
-        
-        # Vision capabilities
-        if any(keyword in model_name.lower() for keyword in ['vision', 'vl', 'visual', 'llava', 'clip']):
-            capabilities.append("👁️ Vision")
-        
-        # Code capabilities
-        if any(keyword in model_name.lower() for keyword in ['code', 'coder', 'coding']):
-            capabilities.append("💻 Code")
-        
-        # Embedding capabilities
-        if 'embed' in model_name.lower():
-            capabilities.append("🔗 Embed")
+    def update_model_marks(self, *model_names: str):
+        """Re-sync starred/queued state of loaded models with starred_models and deletion_queue.
         
-        # Tool use capabilities (common in newer models)
-        if any(keyword in model_name.lower() for keyword in ['tool', 'function', 'agent']):
-            capabilities.append("🛠️ Tools")
-        
-        # Reasoning capabilities
-        if any(keyword in model_name.lower() for keyword in ['r1', 'reasoning', 'think']):
-            capabilities.append("🧠 Reasoning")
+        With no names given, every loaded model is updated.
+        """
+        if model_names:
+            models = [self._models_by_name[name] for name in model_names if name in self._models_by_name]
+        else:
+            models = self.models_data
+        for model in models:
+            model['is_starred'] = model['name'] in self.starred_models
+            model['is_queued_for_deletion'] = model['name'] in self.deletion_queue
+            flags = model['flags'] & ~(F_STARRED | F_QUEUED)
+            if model['is_starred']:
+                flags |= F_STARRED
+            if model['is_queued_for_deletion']:
+                flags |= F_QUEUED
+            model['flags'] = flags
+    
+    def parse_days_old(self, modified_str: str) -> Optional[int]:
+        """Convert a relative time like '3 weeks ago' into a whole number of days."""
+        return _days_old_for(modified_str.lower())
+    
+    def get_age_category(self, days_old: Optional[int]) -> Tuple[str, str]:
+        """Determine the age category and color for a model based on days since last modified."""
+        if days_old is None:
+            # Default for unclear time formats
+            return "Unknown", self.colors['text_secondary']
+        elif days_old <= 14:
+            return "Recently Used", self.colors['accent_green']
+        elif days_old <= 28:
+            return "Moderately Used", self.colors['accent_yellow']
+        else:
+            return "Old Model", self.colors['accent_red']
+    
+    def determine_capabilities(self, model_name: str) -> Tuple[str, int]:
+        """Determine model capabilities based on the model name.
         
-        return " ".join(capabilities) if capabilities else "📝 Text"
+        Returns the display string and the CAP_* bitmask.
+        """
+        return _capabilities_for(model_name.lower())
     
     def get_model_status(self, model_name: str) -> str:
         """Get the current status of a model."""
         # This could be extended to check if model is currently loaded/running
         return "🟢 Available"
     
-    def populate_tree(self):
-        """Populate the treeview with model data."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add models to tree
-        for model in self.filtered_models:
-            # Build status icons string - start with age indicator
-            if model['age_category'] == 'Recently Used':
-                status_icons = "🟢"
-            elif model['age_category'] == 'Moderately Used':
-                status_icons = "🟡"
-            else:
-                status_icons = "🔴"
-            
-            # Add special status indicators
-            if model.get('is_starred', False):
-                status_icons += "⭐"
-            if model.get('is_liberated', False):
-                status_icons += "🔓"
-            if model.get('is_queued_for_deletion', False):
-                status_icons += "🗑️"
-            if model.get('is_duplicate', False):
-                status_icons += "🔄"  # Duplicate indicator
-            elif model.get('variant_info') and model.get('is_special_variant', False):
-                status_icons += "🔀"  # Special variant indicator
-            
-            # Add OpenWebUI usage indicators
-            usage_info = model.get('usage_info')
-            if usage_info:
-                usage_count = usage_info.get('usage_count', 0)
-                if usage_count > 50:
-                    status_icons += "🔥"  # Heavily used
-                elif usage_count > 10:
-                    status_icons += "📊"  # Frequently used
-                elif usage_count > 0:
-                    status_icons += "💬"  # Used
-            
-            item_id = self.tree.insert('', 'end', values=(
-                status_icons,
-                model['name'],
-                model['size'],
-                model['modified'],
-                model['capabilities'],
-                model['status'],
-                model['id'][:12] + "..."  # Truncate ID for display
-            ))
-            
-            # Set row colors based on status (but not for liberated models anymore)
-            if model.get('is_queued_for_deletion', False):
-                # Highlight models queued for deletion
-                self.tree.item(item_id, tags=('deletion',))
-            elif model.get('is_starred', False):
-                # Highlight starred models
-                self.tree.item(item_id, tags=('starred',))
-        
-        # Configure tag colors (removed liberated tag since we're not highlighting those rows anymore)
-        self.tree.tag_configure('deletion', background=self.colors['deletion'], foreground='white')
-        self.tree.tag_configure('starred', background=self.colors['accent_pink'], foreground=self.colors['bg_primary'])
+    def populate_tree(self, reset_window: bool = False):
+        """Populate the treeview with model data.
+        
+        Rows are keyed by model name and updated in place: unchanged rows are left
+        alone, changed rows are rewritten, and rows that drop out of the filter are
+        detached (not deleted) so they can be reattached cheaply later.
+        
+        Long lists are rendered as a window over filtered_models that grows as the
+        user scrolls towards its end (see on_tree_yscroll). Pass reset_window=True
+        when the list contents change so the window starts from the top again.
+        """
+        if reset_window or not self._rendered_limit:
+            self._rendered_limit = TREE_RENDER_THRESHOLD
+        if len(self.filtered_models) <= TREE_RENDER_THRESHOLD:
+            visible_models = self.filtered_models
+        else:
+            visible_models = self.filtered_models[:self._rendered_limit]
+        
+        self.sync_tree_rows(visible_models)
+        if reset_window:
+            # New contents start from the top, like a freshly built list
+            self.tree.yview_moveto(0)
         
         # Update count
         self.count_label.config(text=f"📊 {len(self.filtered_models)} models displayed")
         
-        # Update total storage
-        _, total_storage_text = self.calculate_total_storage()
-        self.storage_label.config(text=f"💾 Total Storage: {total_storage_text}")
+        # Update total storage (only recomputed when a new model list was loaded)
+        if self._storage_cache[0] != self._models_version:
+            self._storage_cache = (self._models_version, self.calculate_total_storage()[1])
+        self.storage_label.config(text=f"💾 Total Storage: {self._storage_cache[1]}")
         
         # Count duplicates and variants in filtered models
-        duplicate_count = sum(1 for model in self.filtered_models if model.get('is_duplicate', False))
-        variant_count = sum(1 for model in self.filtered_models if model.get('is_special_variant', False))
+        duplicate_count = sum(1 for model in self.filtered_models if model['flags'] & F_DUPLICATE)
+        variant_count = sum(1 for model in self.filtered_models if model['flags'] & F_SPECIAL)
         
         # Enhanced count display
         count_text = f"📊 {len(self.filtered_models)} models"
@@ -601,108 +1264,171 @@ class OllamaModelViewer:
         # Update queue button
         self.update_queue_button()
     
+    def build_tree_row(self, model: Dict) -> Tuple[Tuple, Tuple]:
+        """Build the (values, tags) a model's tree row should currently show."""
+        values = (_status_icons_for(model['flags']),) + model['row_values']
+        
+        # Set row colors based on status (but not for liberated models anymore)
+        if model['flags'] & F_QUEUED:
+            # Highlight models queued for deletion
+            tags = ('deletion',)
+        elif model['flags'] & F_STARRED:
+            # Highlight starred models
+            tags = ('starred',)
+        else:
+            # Otherwise tint the text by age category
+            tags = (model['age_tag'],)
+        return values, tags
+    
+    def refresh_model_row(self, model_name: str):
+        """Redraw one model's row after its starred/queued state changed."""
+        if self.filter_var.get() in DYNAMIC_FILTERS:
+            # The change may move the model in or out of the filter
+            self.schedule_apply_filters(delay_ms=0)
+            return
+        model = self._models_by_name.get(model_name)
+        if model is None or model_name not in self._row_cache:
+            return  # Not rendered yet; populate_tree will build it with the new state
+        values, tags = self.build_tree_row(model)
+        row = (values, tags)
+        if self._row_cache[model_name] != row:
+            self.tree.item(model_name, values=values, tags=tags)
+            self._row_cache[model_name] = row
+    
+    def schedule_populate(self):
+        """Coalesce repopulate requests into a single populate_tree() on the next idle cycle."""
+        if self.filter_var.get() in DYNAMIC_FILTERS:
+            self.schedule_apply_filters(delay_ms=0)
+        elif self._populate_job is None:
+            self._populate_job = self.root.after_idle(self._run_scheduled_populate)
+    
+    def _run_scheduled_populate(self):
+        """Idle callback for schedule_populate()."""
+        self._populate_job = None
+        self.populate_tree()
+    
+    def sync_tree_rows(self, visible_models: List[Dict]):
+        """Bring the tree's rows in line with visible_models, touching only what changed."""
+        desired_order = []
+        
+        for model in visible_models:
+            values, tags = self.build_tree_row(model)
+            row = (values, tags)
+            iid = model['name']
+            desired_order.append(iid)
+            if iid not in self._row_cache:
+                self.tree.insert('', 'end', iid=iid, values=values, tags=tags)
+            elif self._row_cache[iid] != row:
+                self.tree.item(iid, values=values, tags=tags)
+            self._row_cache[iid] = row
+        
+        # Drop rows for models that no longer exist, detach rows hidden by the filter
+        stale = [iid for iid in self._row_cache if iid not in self._models_by_name]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._row_cache[iid]
+        
+        desired_set = set(desired_order)
+        hidden = [iid for iid in self.tree.get_children() if iid not in desired_set]
+        if hidden:
+            self.tree.detach(*hidden)
+        
+        # Reorder/reattach only when the visible order actually changed
+        if list(self.tree.get_children()) != desired_order:
+            for index, iid in enumerate(desired_order):
+                self.tree.move(iid, '', index)
+    
+    def on_tree_yscroll(self, first: str, last: str):
+        """Mirror tree scrolling onto the scrollbar and render more rows near the end."""
+        self.v_scrollbar.set(first, last)
+        if (float(last) >= 0.9 and self._render_more_job is None
+                and self._rendered_limit < len(self.filtered_models)):
+            # Defer: inserting rows from inside the scroll callback would re-enter it
+            self._render_more_job = self.root.after_idle(self.render_more_rows)
+    
+    def render_more_rows(self):
+        """Extend the rendered window by another chunk of rows."""
+        self._render_more_job = None
+        self._rendered_limit += TREE_RENDER_CHUNK
+        self.populate_tree()
+    
     def refresh_models(self):
         """Refresh the model list."""
         self.load_models()
     
     def update_status(self, message: str):
-        """Update the status bar message."""
-        self.status_label.config(text=message)
-        self.root.update_idletasks()
+        """Update the status bar message (redrawn on Tk's next idle cycle)."""
+        self.status_var.set(message)
     
     def on_search_change(self, *args):
         """Handle search text changes."""
-        search_term = self.search_var.get().lower()
-        self.apply_filters()
+        self.schedule_apply_filters()
     
     def on_filter_change(self, *args):
         """Handle filter changes."""
-        self.apply_filters()
+        self.schedule_apply_filters()
+    
+    def schedule_apply_filters(self, delay_ms: int = 150):
+        """Debounce filter updates so a burst of keystrokes triggers a single refresh."""
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(delay_ms, self.apply_filters)
     
     def apply_filters(self):
         """Apply search and filter criteria to the model list."""
+        self._filter_job = None
         search_term = self.search_var.get().lower()
         filter_value = self.filter_var.get()
         
-        self.filtered_models = []
+        # Static category filters come precomputed from the index, starred/queued are read from
+        # their name sets; only the rest are evaluated per model
+        candidates = self._filter_index.get(filter_value)
+        marked_names = self.marked_names_for_filter(filter_value)
+        if candidates is None and marked_names is not None:
+            candidates = sorted((self._models_by_name[name] for name in marked_names if name in self._models_by_name),
+                                key=itemgetter('position'))
+        elif candidates is None:
+            now = datetime.datetime.now()
+            candidates = [model for model in self.models_data if self.model_matches_filter(model, filter_value, now)]
         
-        for model in self.models_data:
-            # Apply search filter
-            if search_term and search_term not in model['name'].lower():
-                continue
-            
-            # Apply category filter
-            if filter_value == 'Recently Used (< 2 weeks)' and model['age_category'] != 'Recently Used':
-                continue
-            elif filter_value == 'Moderately Used (2-4 weeks)' and model['age_category'] != 'Moderately Used':
-                continue
-            elif filter_value == 'Old Models (1+ month)' and model['age_category'] != 'Old Model':
-                continue
-            elif filter_value == 'Vision Models' and '👁️ Vision' not in model['capabilities']:
-                continue
-            elif filter_value == 'Text Models' and '📝 Text' not in model['capabilities']:
-                continue
-            elif filter_value == 'Large Models (>10GB)':
-                try:
-                    size_gb = float(model['size'].split()[0])
-                    if size_gb <= 10:
-                        continue
-                except:
-                    continue
-            elif filter_value == 'Small Models (<5GB)':
-                try:
-                    size_gb = float(model['size'].split()[0])
-                    if size_gb >= 5:
-                        continue
-                except:
-                    continue
-            elif filter_value == '⭐ Starred Models' and not model.get('is_starred', False):
-                continue
-            elif filter_value == '🔓 Liberated Models' and not model.get('is_liberated', False):
-                continue
-            elif filter_value == '🗑️ Queued for Deletion' and not model.get('is_queued_for_deletion', False):
-                continue
-            elif filter_value == '🔄 Duplicate Models' and not model.get('is_duplicate', False):
-                continue
-            elif filter_value == '🔀 Special Variants' and not model.get('is_special_variant', False):
-                continue
-            elif filter_value == '📦 Model Families (2+ models)' and not model.get('variant_info'):
-                continue
-            
-            # OpenWebUI Usage-based filters
-            elif filter_value == '📊 Used in OpenWebUI':
-                usage_info = model.get('usage_info')
-                if not usage_info or usage_info.get('usage_count', 0) == 0:
-                    continue
-            elif filter_value == '❌ Never Used in OpenWebUI':
-                usage_info = model.get('usage_info')
-                if usage_info and usage_info.get('usage_count', 0) > 0:
-                    continue
-            elif filter_value == '🔥 Frequently Used (>10 chats)':
-                usage_info = model.get('usage_info')
-                if not usage_info or usage_info.get('usage_count', 0) <= 10:
-                    continue
-            elif filter_value == '⚡ Recent OpenWebUI Activity':
-                usage_info = model.get('usage_info')
-                if not usage_info or not usage_info.get('last_used'):
-                    continue
-                # Check if used in last 7 days
-                try:
-                    last_used = usage_info['last_used']
-                    if isinstance(last_used, (int, float)):
-                        last_used_date = datetime.datetime.fromtimestamp(last_used)
-                    else:
-                        last_used_date = datetime.datetime.fromisoformat(str(last_used).replace('Z', '+00:00'))
-                    
-                    days_ago = (datetime.datetime.now() - last_used_date).days
-                    if days_ago > 7:
-                        continue
-                except:
-                    continue
-            
-            self.filtered_models.append(model)
+        # Apply search filter
+        if search_term:
+            self.filtered_models = [model for model in candidates if search_term in model['name_lower']]
+        else:
+            self.filtered_models = list(candidates)
         
-        self.populate_tree()
+        self.populate_tree(reset_window=True)
+    
+    def marked_names_for_filter(self, filter_value: str) -> Optional[Set[str]]:
+        """Return the name set that defines a starred/queued filter, or None for other filters."""
+        if filter_value == '⭐ Starred Models':
+            return self.starred_models
+        if filter_value == '🗑️ Queued for Deletion':
+            return self.deletion_queue
+        return None
+    
+    def model_matches_filter(self, model: Dict, filter_value: str,
+                             now: Optional[datetime.datetime] = None) -> bool:
+        """Check whether a model passes the selected category filter.
+        
+        Pass now when checking many models so the clock is read once per pass.
+        """
+        mask = FILTER_MASKS.get(filter_value)
+        if mask:
+            return bool(model['flags'] & mask)
+        predicate = FILTER_PREDICATES.get(filter_value)
+        return predicate is None or predicate(model, now or datetime.datetime.now())
+    
+    def build_filter_index(self):
+        """Precompute the matching models for every filter that only depends on load-time data."""
+        self._filter_index = {'All Models': self.models_data}
+        now = datetime.datetime.now()
+        for filter_value in FILTER_OPTIONS:
+            if filter_value not in DYNAMIC_FILTERS and filter_value not in self._filter_index:
+                self._filter_index[filter_value] = [
+                    model for model in self.models_data if self.model_matches_filter(model, filter_value, now)
+                ]
     
     def sort_by_column(self, column: str):
         """Sort the model list by the specified column."""
@@ -712,14 +1438,21 @@ class OllamaModelViewer:
             self.current_sort = column
             self.sort_reverse = False
         
-        if column == 'name':
-            self.filtered_models.sort(key=lambda x: x['name'], reverse=self.sort_reverse)
-        elif column == 'size':
-            self.filtered_models.sort(key=lambda x: float(x['size'].split()[0]), reverse=self.sort_reverse)
-        elif column == 'modified':
-            self.filtered_models.sort(key=lambda x: x['modified'], reverse=self.sort_reverse)
+        sort_key = SORT_KEYS.get(column)
+        if sort_key:
+            # Each (column, direction) is sorted once per load; later clicks just filter that order
+            cache_key = (column, self.sort_reverse)
+            ordered = self._sorted_cache.get(cache_key)
+            if ordered is None:
+                ordered = sorted(self.models_data, key=sort_key, reverse=self.sort_reverse)
+                self._sorted_cache[cache_key] = ordered
+            if len(self.filtered_models) == len(self.models_data):
+                self.filtered_models = list(ordered)
+            else:
+                visible_names = {model['name'] for model in self.filtered_models}
+                self.filtered_models = [model for model in ordered if model['name'] in visible_names]
         
-        self.populate_tree()
+        self.populate_tree(reset_window=True)
     
     def on_sort_change(self, event):
         """Handle sort dropdown changes."""
@@ -741,21 +1474,24 @@ class OllamaModelViewer:
     
     def show_model_details(self, model_name: str):
         """Show detailed information about a model."""
-        # Find the model data
-        model_data = None
-        for model in self.models_data:
-            if model['name'] == model_name:
-                model_data = model
-                break
-        
+        model_data = self._models_by_name.get(model_name)
         if not model_data:
             return
         
-        # Create detail window
+        # Reuse the window built on a previous open
+        detail_window = self._detail_windows.get(model_name)
+        if detail_window is not None and detail_window.winfo_exists():
+            detail_window.deiconify()
+            detail_window.lift()
+            return
+        
+        # Create detail window (closing only hides it so it can be reopened instantly)
         detail_window = tk.Toplevel(self.root)
         detail_window.title(f"📋 Model Details: {model_name}")
         detail_window.geometry("600x500")
         detail_window.configure(bg=self.colors['bg_primary'])
+        detail_window.protocol("WM_DELETE_WINDOW", detail_window.withdraw)
+        self._detail_windows[model_name] = detail_window
         
         # Create scrollable frame
         canvas = tk.Canvas(detail_window, bg=self.colors['bg_primary'])
@@ -790,8 +1526,7 @@ class OllamaModelViewer:
         # Add family information
         variant_info = model_data.get('variant_info')
         if variant_info:
-            base_name = self.get_model_base_name(model_data['name'])
-            family_info = f"Family: {base_name} ({variant_info['total_count']} models)"
+            family_info = f"Family: {model_data['base_name']} ({variant_info['total_count']} models)"
             if variant_info['special_variants']:
                 family_info += f"\nSpecial variants: {', '.join(variant_info['special_variants'])}"
             if len(variant_info['regular_duplicates']) > 1:
@@ -804,58 +1539,111 @@ class OllamaModelViewer:
             details.append(("📊 OpenWebUI Usage", ""))
             details.append(("   💬 Total Chats", str(usage_info.get('usage_count', 0))))
             details.append(("   🪙 Total Tokens", f"{usage_info.get('total_tokens', 0):,}"))
+            now = datetime.datetime.now()
             if usage_info.get('last_used'):
-                last_used_formatted = self.format_last_used_time(usage_info['last_used'])
+                last_used_formatted = self.format_last_used_time(usage_info['last_used'], now)
                 details.append(("   🕒 Last Used", last_used_formatted))
             if usage_info.get('first_used'):
-                first_used_formatted = self.format_last_used_time(usage_info['first_used'])
+                first_used_formatted = self.format_last_used_time(usage_info['first_used'], now)
                 details.append(("   🎂 First Used", first_used_formatted))
         else:
             details.append(("📊 OpenWebUI Usage", "Never used in OpenWebUI"))
         
+        label_font = self.named_font(FONT_MEDIUM_BOLD)
+        value_font = self.named_font(FONT_BODY)
         for i, (label, value) in enumerate(details):
             label_widget = ttk.Label(scrollable_frame, 
                                    text=label, 
                                    style='Custom.TLabel',
-                                   font=('SF Pro Display', 12, 'bold'))
+                                   font=label_font)
             label_widget.pack(anchor='w', padx=20, pady=(10, 5))
             
             value_widget = ttk.Label(scrollable_frame, 
                                    text=value, 
                                    style='Custom.TLabel',
-                                   font=('SF Pro Display', 11))
+                                   font=value_font)
             value_widget.pack(anchor='w', padx=40, pady=(0, 10))
         
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
+    def named_font(self, spec: Tuple) -> tkfont.Font:
+        """Shared Font for a FONT_* spec, so repeated widgets reuse one native font."""
+        font = self._fonts.get(spec)
+        if font is None:
+            family, size, *style = spec
+            font = tkfont.Font(root=self.root, family=family, size=size,
+                               weight=style[0] if style else 'normal')
+            self._fonts[spec] = font
+        return font
+    
+    def close_detail_windows(self):
+        """Destroy all cached model detail windows."""
+        for detail_window in self._detail_windows.values():
+            if detail_window.winfo_exists():
+                detail_window.destroy()
+        self._detail_windows.clear()
+    
     def run(self):
         """Start the application."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            if self._config_conn is not None:
+                self._config_conn.close()  # Checkpoints the WAL back into the config database
 
     def load_config(self):
-        """Load configuration from file."""
+        """Open the config database and load starred models, migrating the old JSON config once."""
         try:
-            if self.config_file.exists():
+            conn = sqlite3.connect(str(self.config_db))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS starred (name TEXT PRIMARY KEY);
+                CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT);
+            """)
+            self._config_conn = conn
+            self.starred_models = {name for (name,) in conn.execute("SELECT name FROM starred")}
+            
+            migrated = conn.execute("SELECT value FROM kv WHERE key = 'json_migrated'").fetchone()
+            if not migrated and self.config_file.exists():
                 with open(self.config_file, 'r') as f:
                     config = json.load(f)
-                    self.starred_models = set(config.get('starred_models', []))
-                    # Could add other settings here in the future
+                self.starred_models |= set(config.get('starred_models', []))
+                self.save_config()
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO kv VALUES ('json_migrated', '1')")
         except Exception as e:
             print(f"Warning: Could not load config: {e}")
             self.starred_models = set()
     
     def save_config(self):
-        """Save configuration to file."""
+        """Write the full set of starred models to the config database."""
+        if self._config_conn is None:
+            return
         try:
-            config = {
-                'starred_models': list(self.starred_models),
-                'last_updated': datetime.datetime.now().isoformat()
-            }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
+            with self._config_conn as conn:
+                conn.execute("DELETE FROM starred")
+                conn.executemany("INSERT INTO starred VALUES (?)", [(name,) for name in self.starred_models])
+                conn.execute("INSERT OR REPLACE INTO kv VALUES ('last_updated', ?)",
+                             (datetime.datetime.now().isoformat(),))
+        except sqlite3.Error as e:
+            print(f"Warning: Could not save config: {e}")
+    
+    def save_star(self, model_name: str, starred: bool):
+        """Persist a single star change (one row insert/delete instead of rewriting the config)."""
+        if self._config_conn is None:
+            return
+        try:
+            with self._config_conn as conn:
+                if starred:
+                    conn.execute("INSERT OR IGNORE INTO starred VALUES (?)", (model_name,))
+                else:
+                    conn.execute("DELETE FROM starred WHERE name = ?", (model_name,))
+                conn.execute("INSERT OR REPLACE INTO kv VALUES ('last_updated', ?)",
+                             (datetime.datetime.now().isoformat(),))
+        except sqlite3.Error as e:
             print(f"Warning: Could not save config: {e}")
     
     def toggle_star(self, model_name: str):
@@ -864,44 +1652,13 @@ class OllamaModelViewer:
             self.starred_models.remove(model_name)
         else:
             self.starred_models.add(model_name)
-        self.save_config()
-        self.populate_tree()  # Refresh the display
+        self.save_star(model_name, model_name in self.starred_models)
+        self.update_model_marks(model_name)
+        self.refresh_model_row(model_name)  # Refresh the display
     
     def is_liberated_model(self, model_name: str) -> bool:
         """Check if a model is likely uncensored/liberated based on keywords."""
-        model_lower = model_name.lower()
-        return any(keyword in model_lower for keyword in self.liberation_keywords)
-    
-    def get_storage_estimate(self, model_names: List[str]) -> Tuple[float, str]:
-        """Calculate total storage that would be recovered by deleting models."""
-        total_bytes = 0
-        for model_name in model_names:
-            for model in self.models_data:
-                if model['name'] == model_name:
-                    try:
-                        # Parse size (e.g., "4.7 GB" -> 4.7)
-                        size_parts = model['size'].split()
-                        if len(size_parts) >= 2:
-                            size_value = float(size_parts[0])
-                            size_unit = size_parts[1].upper()
-                            
-                            # Convert to bytes
-                            if size_unit in ['GB', 'G']:
-                                total_bytes += size_value * 1024 * 1024 * 1024
-                            elif size_unit in ['MB', 'M']:
-                                total_bytes += size_value * 1024 * 1024
-                            elif size_unit in ['KB', 'K']:
-                                total_bytes += size_value * 1024
-                    except (ValueError, IndexError):
-                        continue
-        
-        # Convert back to human readable
-        if total_bytes >= 1024 * 1024 * 1024:
-            return total_bytes / (1024 * 1024 * 1024), f"{total_bytes / (1024 * 1024 * 1024):.1f} GB"
-        elif total_bytes >= 1024 * 1024:
-            return total_bytes / (1024 * 1024), f"{total_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return total_bytes / 1024, f"{total_bytes / 1024:.1f} KB"
+        return self._liberation_re.search(model_name) is not None
     
     def get_model_base_name(self, model_name: str) -> str:
         """Extract the base model name without parameters."""
@@ -920,45 +1677,40 @@ class OllamaModelViewer:
     
     def is_special_variant(self, model_name: str) -> bool:
         """Check if a model has special parameter suffixes that make it a meaningful variant."""
-        params = self.get_model_params(model_name)
-        if not params:
-            return False
-        
-        # Check for special suffixes
-        for suffix in self.special_suffixes:
-            if suffix in params:
-                return True
-        return False
+        return self.has_special_suffix(self.get_model_params(model_name))
+    
+    def has_special_suffix(self, params: str) -> bool:
+        """Check a lowercased parameter tag (the part after ':') for special variant suffixes."""
+        return bool(params) and not self._special_suffix_set.isdisjoint(PARAM_TOKEN_SPLIT.split(params))
     
-    def detect_duplicates(self):
-        """Detect duplicate models and variants within model families."""
-        model_families = {}
+    def detect_duplicates(self, models: List[Dict]):
+        """Detect duplicate models and variants within model families.
+        
+        Expects model dicts from build_models_data (with 'base_name' and
+        'is_special_variant' already filled in).
+        """
+        model_families = defaultdict(list)
         duplicates = set()
         variants = {}
         
-        # Group models by base name
-        for model in self.models_data:
-            base_name = self.get_model_base_name(model['name'])
-            params = self.get_model_params(model['name'])
-            
-            if base_name not in model_families:
-                model_families[base_name] = []
-            model_families[base_name].append(model['name'])
+        # Group models by base name in a single pass
+        for model in models:
+            model_families[model['base_name']].append(model)
         
         # Identify duplicates and variants
-        for base_name, models in model_families.items():
-            if len(models) > 1:
+        for base_name, family in model_families.items():
+            if len(family) > 1:
                 # Sort models to ensure consistent ordering
-                models.sort()
+                family.sort(key=itemgetter('name'))
                 
                 special_variants = []
                 regular_duplicates = []
                 
-                for model_name in models:
-                    if self.is_special_variant(model_name):
-                        special_variants.append(model_name)
+                for model in family:
+                    if model['is_special_variant']:
+                        special_variants.append(model['name'])
                     else:
-                        regular_duplicates.append(model_name)
+                        regular_duplicates.append(model['name'])
                 
                 # Mark regular duplicates (keep the first one unmarked)
                 if len(regular_duplicates) > 1:
@@ -970,42 +1722,14 @@ class OllamaModelViewer:
                     variants[base_name] = {
                         'special_variants': special_variants,
                         'regular_duplicates': regular_duplicates,
-                        'total_count': len(models)
+                        'total_count': len(family)
                     }
         
         return duplicates, variants
     
     def calculate_total_storage(self) -> Tuple[float, str]:
         """Calculate total storage used by all models."""
-        total_bytes = 0
-        
-        for model in self.models_data:
-            try:
-                # Parse size (e.g., "4.7 GB" -> 4.7)
-                size_parts = model['size'].split()
-                if len(size_parts) >= 2:
-                    size_value = float(size_parts[0])
-                    size_unit = size_parts[1].upper()
-                    
-                    # Convert to bytes
-                    if size_unit in ['GB', 'G']:
-                        total_bytes += size_value * 1024 * 1024 * 1024
-                    elif size_unit in ['MB', 'M']:
-                        total_bytes += size_value * 1024 * 1024
-                    elif size_unit in ['KB', 'K']:
-                        total_bytes += size_value * 1024
-            except (ValueError, IndexError):
-                continue
-        
-        # Convert back to human readable
-        if total_bytes >= 1024 * 1024 * 1024 * 1024:  # TB
-            return total_bytes / (1024 * 1024 * 1024 * 1024), f"{total_bytes / (1024 * 1024 * 1024 * 1024):.1f} TB"
-        elif total_bytes >= 1024 * 1024 * 1024:  # GB
-            return total_bytes / (1024 * 1024 * 1024), f"{total_bytes / (1024 * 1024 * 1024):.1f} GB"
-        elif total_bytes >= 1024 * 1024:  # MB
-            return total_bytes / (1024 * 1024), f"{total_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return total_bytes / 1024, f"{total_bytes / 1024:.1f} KB"
+        return self.format_storage(sum(model['size_bytes'] for model in self.models_data))
 
     def show_context_menu(self, event):
         """Show the context menu for right-click actions."""
@@ -1037,9 +1761,8 @@ class OllamaModelViewer:
         if selection:
             item = self.tree.item(selection[0])
             model_name = item['values'][1]  # Name is in column 1 now
-            self.deletion_queue.add(model_name)
-            self.update_queue_button()
-            self.populate_tree()
+            self.add_to_queue(model_name)
+            self.refresh_model_row(model_name)
     
     def context_remove_from_queue(self):
         """Remove the selected model from the deletion queue."""
@@ -1048,9 +1771,8 @@ class OllamaModelViewer:
             item = self.tree.item(selection[0])
             model_name = item['values'][1]  # Name is in column 1 now
             if model_name in self.deletion_queue:
-                self.deletion_queue.remove(model_name)
-                self.update_queue_button()
-                self.populate_tree()
+                self.remove_from_queue(model_name)
+                self.refresh_model_row(model_name)
     
     def context_copy_name(self):
         """Copy the name of the selected model to the clipboard."""
@@ -1062,11 +1784,49 @@ class OllamaModelViewer:
             self.root.clipboard_append(model_name)
             self.update_status(f"📋 Copied '{model_name}' to clipboard")
     
+    def add_to_queue(self, model_name: str):
+        """Queue a model for deletion."""
+        if model_name in self.deletion_queue:
+            return
+        self.deletion_queue.add(model_name)
+        self._sorted_queue = None
+        model = self._models_by_name.get(model_name)
+        if model:
+            self._queue_bytes += model['size_bytes']
+        self.update_model_marks(model_name)
+        self.update_queue_button()
+    
+    def remove_from_queue(self, model_name: str):
+        """Take a model out of the deletion queue."""
+        if model_name not in self.deletion_queue:
+            return
+        self.deletion_queue.remove(model_name)
+        self._sorted_queue = None
+        model = self._models_by_name.get(model_name)
+        if model:
+            self._queue_bytes -= model['size_bytes']
+        self.update_model_marks(model_name)
+        self.update_queue_button()
+    
+    def clear_queue(self):
+        """Empty the deletion queue."""
+        self.deletion_queue.clear()
+        self._sorted_queue = None
+        self._queue_bytes = 0
+        self.update_model_marks()
+        self.update_queue_button()
+    
+    def sorted_queue(self) -> List[str]:
+        """Queued model names in sorted order (cached until the queue changes)."""
+        if self._sorted_queue is None:
+            self._sorted_queue = sorted(self.deletion_queue)
+        return self._sorted_queue
+    
     def update_queue_button(self):
         """Update the deletion queue button text."""
         queue_size = len(self.deletion_queue)
         if queue_size > 0:
-            _, storage_text = self.get_storage_estimate(list(self.deletion_queue))
+            _, storage_text = self.format_storage(self._queue_bytes)
             self.queue_btn.config(text=f"🗑️ Queue ({queue_size}) - {storage_text}")
             self.queue_btn.config(bg=self.colors['error'])
         else:
@@ -1091,15 +1851,15 @@ class OllamaModelViewer:
         
         title_label = ttk.Label(header_frame, 
                                text="🗑️ Models Queued for Deletion", 
-                               font=('SF Pro Display', 18, 'bold'),
+                               font=FONT_TITLE,
                                foreground=self.colors['error'])
         title_label.pack()
         
         # Storage estimate
-        _, storage_text = self.get_storage_estimate(list(self.deletion_queue))
+        _, storage_text = self.format_storage(self._queue_bytes)
         storage_label = ttk.Label(header_frame,
                                  text=f"💾 Total Storage to Recover: {storage_text}",
-                                 font=('SF Pro Display', 14, 'bold'),
+                                 font=FONT_LARGE_BOLD,
                                  foreground=self.colors['accent_green'])
         storage_label.pack(pady=(10, 0))
         
@@ -1111,21 +1871,26 @@ class OllamaModelViewer:
         queue_listbox = tk.Listbox(list_frame,
                                   bg=self.colors['bg_tertiary'],
                                   fg=self.colors['text_primary'],
-                                  font=('SF Pro Display', 12),
+                                  font=FONT_MEDIUM,
                                   selectbackground=self.colors['accent_blue'],
                                   height=15)
         
-        # Add models to listbox with details
-        for model_name in sorted(self.deletion_queue):
-            for model in self.models_data:
-                if model['name'] == model_name:
-                    display_text = f"🗑️ {model_name} ({model['size']})"
-                    if model.get('is_starred'):
-                        display_text = f"⭐{display_text}"
-                    if model.get('is_liberated'):
-                        display_text = f"🔓{display_text}"
-                    queue_listbox.insert(tk.END, display_text)
-                    break
+        # Add models to listbox with details (one insert call for all rows)
+        rows = []
+        row_names = []  # Model name for each listbox row, by index
+        for model_name in self.sorted_queue():
+            model = self._models_by_name.get(model_name)
+            if model is None:
+                continue
+            display_text = f"🗑️ {model_name} ({model['size']})"
+            if model.get('is_starred'):
+                display_text = f"⭐{display_text}"
+            if model.get('is_liberated'):
+                display_text = f"🔓{display_text}"
+            rows.append(display_text)
+            row_names.append(model_name)
+        if rows:
+            queue_listbox.insert(tk.END, *rows)
         
         # Scrollbar for listbox
         scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=queue_listbox.yview)
@@ -1142,17 +1907,14 @@ class OllamaModelViewer:
         def remove_selected():
             selection = queue_listbox.curselection()
             if selection:
-                selected_text = queue_listbox.get(selection[0])
-                # Extract model name from display text
-                model_name = selected_text.split('🗑️ ')[1].split(' (')[0]
-                self.deletion_queue.remove(model_name)
+                model_name = row_names.pop(selection[0])
+                self.remove_from_queue(model_name)
                 queue_listbox.delete(selection[0])
-                self.update_queue_button()
-                self.populate_tree()
+                self.refresh_model_row(model_name)
                 
                 # Update storage estimate
                 if self.deletion_queue:
-                    _, new_storage_text = self.get_storage_estimate(list(self.deletion_queue))
+                    _, new_storage_text = self.format_storage(self._queue_bytes)
                     storage_label.config(text=f"💾 Total Storage to Recover: {new_storage_text}")
                 else:
                     queue_window.destroy()
@@ -1162,16 +1924,15 @@ class OllamaModelViewer:
                               command=remove_selected,
                               bg=self.colors['warning'],
                               fg=self.colors['bg_primary'],
-                              font=('SF Pro Display', 11, 'bold'),
+                              font=FONT_BODY_BOLD,
                               padx=15, pady=8)
         remove_btn.pack(side='left', padx=(0, 10))
         
         # Clear all button
         def clear_all():
             if messagebox.askyesno("Clear Queue", "🗑️ Remove all models from deletion queue?"):
-                self.deletion_queue.clear()
-                self.update_queue_button()
-                self.populate_tree()
+                self.clear_queue()
+                self.schedule_populate()
                 queue_window.destroy()
         
         clear_btn = tk.Button(button_frame,
@@ -1179,7 +1940,7 @@ class OllamaModelViewer:
                              command=clear_all,
                              bg=self.colors['accent_yellow'],
                              fg=self.colors['bg_primary'],
-                             font=('SF Pro Display', 11, 'bold'),
+                             font=FONT_BODY_BOLD,
                              padx=15, pady=8)
         clear_btn.pack(side='left', padx=(0, 10))
         
@@ -1199,7 +1960,7 @@ class OllamaModelViewer:
                                command=execute_deletion,
                                bg=self.colors['error'],
                                fg='white',
-                               font=('SF Pro Display', 12, 'bold'),
+                               font=FONT_MEDIUM_BOLD,
                                padx=20, pady=8)
         execute_btn.pack(side='right')
         
@@ -1209,7 +1970,7 @@ class OllamaModelViewer:
                              command=queue_window.destroy,
                              bg=self.colors['bg_secondary'],
                              fg=self.colors['text_primary'],
-                             font=('SF Pro Display', 11),
+                             font=FONT_BODY,
                              padx=15, pady=8)
         close_btn.pack(side='right', padx=(0, 10))
     
@@ -1218,6 +1979,7 @@ class OllamaModelViewer:
         if not self.deletion_queue:
             return
         
+        model_names = self.sorted_queue()
         deleted_models = []
         failed_deletions = []
         
@@ -1226,10 +1988,12 @@ class OllamaModelViewer:
         progress_window.title("🗑️ Deleting Models")
         progress_window.geometry("500x300")
         progress_window.configure(bg=self.colors['bg_primary'])
+        progress_window.transient(self.root)
+        progress_window.grab_set()  # Modal, so the queue can't be edited while workers run
         
         progress_label = ttk.Label(progress_window,
                                   text="🔄 Deleting models...",
-                                  font=('SF Pro Display', 14),
+                                  font=FONT_LARGE,
                                   foreground=self.colors['text_primary'])
         progress_label.pack(pady=20)
         
@@ -1237,43 +2001,92 @@ class OllamaModelViewer:
                              height=10,
                              bg=self.colors['bg_tertiary'],
                              fg=self.colors['text_primary'],
-                             font=('SF Pro Display', 10))
+                             font=FONT_SMALL)
         status_text.pack(fill='both', expand=True, padx=20, pady=(0, 20))
         
-        # Delete each model
-        for i, model_name in enumerate(list(self.deletion_queue)):
+        for model_name in model_names:
             status_text.insert(tk.END, f"🗑️ Deleting {model_name}...\n")
-            status_text.see(tk.END)
-            progress_window.update()
-            
+        status_text.see(tk.END)
+        
+        # Deletions are I/O bound, so several run at once. Workers only report back through
+        # this queue; the main thread polls it with after() since Tk is not thread-safe.
+        result_queue = queue.Queue()
+        
+        def delete_model(model_name):
             try:
-                # Execute ollama delete command
-                result = subprocess.run(['ollama', 'delete', model_name], 
-                                      capture_output=True, text=True, check=True)
-                deleted_models.append(model_name)
-                status_text.insert(tk.END, f"✅ Successfully deleted {model_name}\n")
-                
-            except subprocess.CalledProcessError as e:
-                failed_deletions.append(model_name)
-                status_text.insert(tk.END, f"❌ Failed to delete {model_name}: {e}\n")
+                subprocess.run(['ollama', 'rm', model_name],
+                               capture_output=True, text=True, check=True)
+                result_queue.put((model_name, None))
+            except (subprocess.CalledProcessError, OSError) as e:
+                result_queue.put((model_name, e))
+        
+        executor = ThreadPoolExecutor(max_workers=DELETE_WORKERS)
+        futures = {executor.submit(delete_model, model_name): model_name for model_name in model_names}
+        executor.shutdown(wait=False)
+        stopped = []
+        
+        def finish_deletions():
+            progress_window.grab_release()
+            
+            # Models the run never started stay queued; anything else leaves the queue
+            skipped = [model_name for future, model_name in futures.items() if future.cancelled()]
+            for model_name in set(model_names).difference(skipped):
+                self.remove_from_queue(model_name)
+            
+            # Show completion message
+            if failed_deletions or skipped:
+                summary = f"✅ Deleted {len(deleted_models)} models\n❌ Failed to delete {len(failed_deletions)} models"
+                running = len(model_names) - len(deleted_models) - len(failed_deletions) - len(skipped)
+                if running:
+                    summary += f"\n⏳ {running} deletions still finishing in the background"
+                if skipped:
+                    summary += f"\n⏹️ Stopped before {len(skipped)} models (still queued)"
+                messagebox.showwarning("Deletion Complete", summary)
+            else:
+                messagebox.showinfo("Deletion Complete", 
+                                   f"✅ Successfully deleted all {len(deleted_models)} models!")
             
-            status_text.see(tk.END)
-            progress_window.update()
+            progress_window.destroy()
+            self.refresh_models()  # Reload the model list
+        
+        def stop_deletions():
+            if not messagebox.askyesno("Stop Deletions",
+                                       "Stop deleting models?\n\nDeletions already running will finish in the background; "
+                                       "models not yet started stay in the queue.",
+                                       parent=progress_window):
+                return
+            stopped.append(True)
+            for future in futures:
+                future.cancel()  # Only succeeds for deletions that haven't started
+            poll_results()
         
-        # Clear the deletion queue and update UI
-        self.deletion_queue.clear()
-        self.update_queue_button()
+        progress_window.protocol("WM_DELETE_WINDOW", stop_deletions)
         
-        # Show completion message
-        if failed_deletions:
-            messagebox.showwarning("Deletion Complete", 
-                                 f"✅ Deleted {len(deleted_models)} models\n❌ Failed to delete {len(failed_deletions)} models")
-        else:
-            messagebox.showinfo("Deletion Complete", 
-                               f"✅ Successfully deleted all {len(deleted_models)} models!")
+        def poll_results():
+            while True:
+                try:
+                    model_name, error = result_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if error is None:
+                    deleted_models.append(model_name)
+                    status_text.insert(tk.END, f"✅ Successfully deleted {model_name}\n")
+                else:
+                    failed_deletions.append(model_name)
+                    status_text.insert(tk.END, f"❌ Failed to delete {model_name}: {error}\n")
+                status_text.see(tk.END)
+            
+            if stopped:
+                if progress_window.winfo_exists():
+                    finish_deletions()
+                return
+            if len(deleted_models) + len(failed_deletions) < len(model_names):
+                self.root.after(100, poll_results)
+                return
+            
+            finish_deletions()
         
-        progress_window.destroy()
-        self.refresh_models()  # Reload the model list
+        self.root.after(100, poll_results)
 
     def keyboard_toggle_star(self, event):
         """Toggle star status for the selected model using keyboard shortcut."""
@@ -1289,9 +2102,8 @@ class OllamaModelViewer:
         if selection:
             item = self.tree.item(selection[0])
             model_name = item['values'][1]  # Name is in column 1 now
-            self.deletion_queue.add(model_name)
-            self.update_queue_button()
-            self.populate_tree()
+            self.add_to_queue(model_name)
+            self.refresh_model_row(model_name)
 
     def keyboard_remove_from_queue(self, event):
         """Remove the selected model from the deletion queue using keyboard shortcut."""
@@ -1300,9 +2112,8 @@ class OllamaModelViewer:
             item = self.tree.item(selection[0])
             model_name = item['values'][1]  # Name is in column 1 now
             if model_name in self.deletion_queue:
-                self.deletion_queue.remove(model_name)
-                self.update_queue_button()
-                self.populate_tree()
+                self.remove_from_queue(model_name)
+                self.refresh_model_row(model_name)
 
     def keyboard_show_details(self, event):
         """Show details for the selected model using keyboard shortcut."""
@@ -1314,210 +2125,132 @@ class OllamaModelViewer:
 
     def show_help(self):
         """Show the help dialog."""
+        # Reuse the window built on a previous open
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+        
+        # Closing only hides the window so it can be reopened instantly
         help_window = tk.Toplevel(self.root)
         help_window.title("🚀 Ollama Model Viewer Help")
         help_window.geometry("600x400")
         help_window.configure(bg=self.colors['bg_primary'])
-        
-        # Create scrollable frame
-        canvas = tk.Canvas(help_window, bg=self.colors['bg_primary'])
-        scrollbar = ttk.Scrollbar(help_window, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style='Custom.TFrame')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Add help content
-        help_content = [
-            ("🚀 Ollama Model Viewer Help", 'header'),
-            ("", 'space'),
-            ("⭐ HOW TO STAR A MODEL:", 'section'),
-            ("Method 1: Right-click any model → ⭐ Toggle Star", 'text'),
-            ("Method 2: Select model → Press 's' key", 'text'),
-            ("", 'space'),
-            ("🗑️ HOW TO DELETE MODELS:", 'section'),
-            ("1. Right-click model → 🗑️ Add to Deletion Queue", 'text'),
-            ("2. Click 🗑️ Queue button in header", 'text'),
-            ("3. Review storage estimate and click 🔥 Delete All", 'text'),
-            ("", 'space'),
-            ("⌨️ KEYBOARD SHORTCUTS:", 'section'),
-            ("S = Star/unstar selected model", 'text'),
-            ("D = Add to deletion queue", 'text'),
-            ("R = Remove from deletion queue", 'text'),
-            ("Enter = Show model details", 'text'),
-            ("", 'space'),
-            ("🎯 STATUS ICONS:", 'section'),
-            ("🟢 = Recently used (< 2 weeks)", 'text'),
-            ("🟡 = Moderately used (2-4 weeks)", 'text'),
-            ("🔴 = Old model (1+ month)", 'text'),
-            ("⭐ = Starred/favorite model", 'text'),
-            ("🔓 = Liberated/uncensored model", 'text'),
-            ("🗑️ = Queued for deletion", 'text'),
-            ("🔄 = Duplicate model", 'text'),
-            ("🔀 = Special variant (e.g., -a3b, -instruct)", 'text'),
-            ("💬 = Used in OpenWebUI", 'text'),
-            ("📊 = Frequently used (>10 chats)", 'text'),
-            ("🔥 = Heavily used (>50 chats)", 'text'),
-            ("", 'space'),
-            ("🔍 QUICK FILTERS:", 'section'),
-            ("Use the dropdown to filter by:", 'text'),
-            ("• ⭐ Starred Models", 'text'),
-            ("• 🔓 Liberated Models", 'text'),
-            ("• 🗑️ Queued for Deletion", 'text'),
-            ("• 🔄 Duplicate Models", 'text'),
-            ("• 🔀 Special Variants", 'text'),
-            ("• 📦 Model Families (2+ models)", 'text'),
-            ("• 📊 Used in OpenWebUI", 'text'),
-            ("• ❌ Never Used in OpenWebUI", 'text'),
-            ("• 🔥 Frequently Used (>10 chats)", 'text'),
-            ("• ⚡ Recent OpenWebUI Activity", 'text'),
-            ("• Size, age, capabilities, etc.", 'text'),
-            ("", 'space'),
-            ("📊 OPENWEBUI INTEGRATION:", 'section'),
-            ("Automatically detects OpenWebUI database", 'text'),
-            ("Shows actual usage stats from chat history", 'text'),
-            ("Track which models you really use", 'text'),
-            ("Filter by usage patterns to find unused models", 'text'),
-            ("", 'space'),
-            ("💾 STORAGE INFO:", 'section'),
-            ("💾 Storage usage shown in status bar", 'text'),
-            ("Duplicate detection helps identify space savings", 'text'),
-            ("Special variants (-a3b, -instruct) are preserved", 'text'),
-            ("Usage data helps identify models safe to delete", 'text'),
-            ("", 'space'),
-            ("🔒 PRIVACY & SECURITY:", 'section'),
-            ("OpenWebUI database automatically encrypted", 'text'),
-            ("Only usage statistics accessed (no chat content)", 'text'),
-            ("All processing happens locally on your machine", 'text'),
-            ("Temporary files securely overwritten after use", 'text'),
-            ("", 'space'),
-            ("🗺️ FUTURE ROADMAP:", 'section'),
-            ("(These features are currently disabled for privacy)", 'text'),
-            ("📚 Chat browsing and search functionality", 'text'),
-            ("📊 Conversation topic analysis", 'text'),
-            ("📋 Export conversations and knowledge", 'text'),
-            ("💾 Personal AI knowledge base creation", 'text'),
-            ("🔍 Advanced usage analytics", 'text')
-        ]
-        
-        for line_data in help_content:
-            if isinstance(line_data, tuple):
-                text, style_type = line_data
-            else:
-                text, style_type = line_data, 'text'
-            
-            if style_type == 'header':
-                font = ('SF Pro Display', 16, 'bold')
-                color = self.colors['accent_blue']
-            elif style_type == 'section':
-                font = ('SF Pro Display', 12, 'bold')
-                color = self.colors['accent_green']
-            elif style_type == 'space':
-                font = ('SF Pro Display', 6)
-                color = self.colors['text_primary']
-            else:
-                font = ('SF Pro Display', 11)
-                color = self.colors['text_primary']
-            
-            if text:  # Don't create empty labels
-                label = tk.Label(scrollable_frame, 
-                                text=text,
-                                bg=self.colors['bg_primary'],
-                                fg=color,
-                                font=font,
-                                anchor='w',
-                                justify='left')
-                label.pack(anchor='w', padx=20, pady=2, fill='x')
-        
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._help_window = help_window
+        
+        # One read-only Text widget with a tag per style, instead of a Label per line
+        text_widget = tk.Text(help_window,
+                              wrap='word',
+                              bg=self.colors['bg_primary'],
+                              fg=self.colors['text_primary'],
+                              font=self.named_font(FONT_BODY),
+                              padx=20, pady=10,
+                              spacing1=2, spacing3=2,
+                              relief='flat',
+                              highlightthickness=0,
+                              cursor='arrow')
+        scrollbar = ttk.Scrollbar(help_window, orient="vertical", command=text_widget.yview)
+        text_widget.configure(yscrollcommand=scrollbar.set)
+        
+        for style_type, (font, color) in HELP_STYLES.items():
+            text_widget.tag_configure(style_type, font=self.named_font(font), foreground=self.colors[color])
+        
+        # Text.insert takes alternating text/tag arguments, so every line goes in with one Tk call
+        text_widget.insert('end', *(part for text, style_type in HELP_CONTENT for part in (text + '\n', style_type)))
+        text_widget.config(state='disabled')
+        
+        # Pack text and scrollbar
         scrollbar.pack(side="right", fill="y")
+        text_widget.pack(side="left", fill="both", expand=True)
 
     def detect_openwebui_path(self):
         """Detect OpenWebUI data directory automatically."""
-        common_paths = [
-            # Temporary copy location
-            Path.home() / "tmp" / "openwebui",
-            # Docker volume mounts
-            Path.home() / "openwebui",
-            Path.home() / "open-webui", 
-            Path.home() / "open_webui",
-            # Default Docker locations
-            Path("/app/backend/data"),
-            Path("/data"),
-            # Local installations
-            Path.home() / ".config" / "open-webui",
-            Path.home() / ".local" / "share" / "open-webui",
-            # Common container mount points
-            Path("/opt/open-webui/data"),
-            Path("/var/lib/open-webui"),
-        ]
-        
         # First try common paths
-        for path in common_paths:
-            db_path = path / "webui.db"
-            if db_path.exists():
-                self.openwebui_data_path = path
-                print(f"✅ Found OpenWebUI database at: {db_path}")
-                return
+        db_file = next((path for path in OPENWEBUI_DB_CANDIDATES if os.path.isfile(path)), None)
+        if db_file:
+            self.openwebui_data_path = Path(db_file).parent
+            print(f"✅ Found OpenWebUI database at: {db_file}")
+            return
         
         # Try to copy from Docker container if running
         try:
-            result = subprocess.run(['docker', 'ps', '--format', '{{.Names}}'], 
+            # Docker matches the name filter as a regex, so only WebUI containers come back
+            # ('open-webui' included); (?i) keeps the old case-insensitive match
+            result = subprocess.run(['docker', 'ps', '--filter', 'name=(?i)webui', '--format', '{{.Names}}'], 
                                   capture_output=True, text=True, check=True)
-            container_names = result.stdout.strip().split('\n')
+            container_names = result.stdout.split()
             
             for container_name in container_names:
-                if 'webui' in container_name.lower() or 'open-webui' in container_name.lower():
-                    # Try to copy database from container
-                    temp_path = Path.home() / "tmp" / "openwebui"
-                    temp_path.mkdir(parents=True, exist_ok=True)
+                # Try to copy database from container
+                temp_path = Path.home() / "tmp" / "openwebui"
+                temp_path.mkdir(parents=True, exist_ok=True)
+                
+                try:
+                    copy_result = subprocess.run([
+                        'docker', 'cp', f'{container_name}:/app/backend/data/webui.db', 
+                        str(temp_path / 'webui.db')
+                    ], capture_output=True, text=True, check=True)
                     
-                    try:
-                        copy_result = subprocess.run([
-                            'docker', 'cp', f'{container_name}:/app/backend/data/webui.db', 
-                            str(temp_path / 'webui.db')
-                        ], capture_output=True, text=True, check=True)
+                    if (temp_path / 'webui.db').exists():
+                        self.openwebui_data_path = temp_path
+                        print(f"✅ Copied OpenWebUI database from Docker container '{container_name}' to: {temp_path / 'webui.db'}")
                         
-                        if (temp_path / 'webui.db').exists():
-                            self.openwebui_data_path = temp_path
-                            print(f"✅ Copied OpenWebUI database from Docker container '{container_name}' to: {temp_path / 'webui.db'}")
-                            
-                            # Encrypt the database for privacy protection
-                            if self.encrypt_database:
-                                self.encrypt_database_file(temp_path / 'webui.db')
-                            
-                            # Show privacy notice to user
-                            self.root.after(1000, self.show_privacy_notice)
-                            return
-                    except subprocess.CalledProcessError:
-                        continue
+                        # The copy (and its encryption) is fresh every launch, so the usage cache
+                        # is keyed on the contents instead of the file's mtime
+                        self._openwebui_source_hash = _file_sha256(temp_path / 'webui.db')
                         
+                        # Encrypt the database for privacy protection
+                        if self.encrypt_database:
+                            self.encrypt_database_file(temp_path / 'webui.db')
+                        
+                        # Show privacy notice to user (from the main thread)
+                        self._privacy_notice_pending = True
+                        return
+                except subprocess.CalledProcessError:
+                    continue
+                    
         except (subprocess.CalledProcessError, FileNotFoundError):
             # Docker not available or no containers
             pass
         
         # Try to find database by searching common locations
-        search_paths = [Path.home(), Path("/opt"), Path("/var/lib")]
-        for search_path in search_paths:
-            if search_path.exists():
-                try:
-                    for db_file in search_path.rglob("webui.db"):
-                        self.openwebui_data_path = db_file.parent
-                        print(f"✅ Found OpenWebUI database at: {db_file}")
-                        return
-                except (PermissionError, OSError):
-                    continue
+        for search_root in OPENWEBUI_SEARCH_ROOTS:
+            if os.path.isdir(search_root):
+                db_file = _find_webui_db(Path(search_root))
+                if db_file:
+                    self.openwebui_data_path = db_file.parent
+                    print(f"✅ Found OpenWebUI database at: {db_file}")
+                    return
         
         print("⚠️ OpenWebUI database not found. Usage data will not be available.")
         print("💡 If you have OpenWebUI in Docker, the database has been automatically copied to ~/tmp/openwebui/")
         print("💡 To manually specify location, you can modify the detect_openwebui_path method")
 
+    def start_openwebui_detection(self):
+        """Run detect_openwebui_path() on a background thread."""
+        threading.Thread(target=self._detect_openwebui_worker, daemon=True).start()
+        self.root.after(100, self._poll_openwebui_detection)
+    
+    def _detect_openwebui_worker(self):
+        """Detect OpenWebUI off the UI thread, then release anyone waiting on it."""
+        try:
+            self.detect_openwebui_path()
+        except Exception as e:
+            print(f"⚠️ OpenWebUI detection failed: {e}")
+        finally:
+            self._openwebui_detected.set()
+    
+    def _poll_openwebui_detection(self):
+        """Show the privacy notice once detection has finished, if it asked for one."""
+        if not self._openwebui_detected.is_set():
+            self.root.after(100, self._poll_openwebui_detection)
+            return
+        self.merge_usage_data()
+        if self._privacy_notice_pending:
+            self._privacy_notice_pending = False
+            self.root.after(1000, self.show_privacy_notice)
+
     def get_openwebui_usage_data(self) -> Dict[str, Dict]:
         """Extract model usage data from OpenWebUI database."""
         if not self.openwebui_data_path:
@@ -1527,6 +2260,25 @@ class OllamaModelViewer:
         db_path = self.openwebui_data_path / "webui.db"
         encrypted_path = self.openwebui_data_path / "webui.db.enc"
         
+        # Reuse the last result while the database is unchanged
+        source_path = encrypted_path if encrypted_path.exists() else db_path
+        try:
+            stat = source_path.stat()
+        except OSError:
+            return {}
+        if source_path == encrypted_path and self._openwebui_source_hash:
+            cache_key = f"sha256:{self._openwebui_source_hash}"
+        else:
+            cache_key = f"{stat.st_mtime_ns}:{stat.st_size}"
+        # A live database in WAL mode takes new chats in webui.db-wal before the main file changes
+        wal_path = source_path.with_name(source_path.name + '-wal')
+        if source_path == db_path and wal_path.exists():
+            wal_stat = wal_path.stat()
+            cache_key += f":{wal_stat.st_mtime_ns}:{wal_stat.st_size}"
+        cached = self.read_usage_cache(cache_key)
+        if cached is not None:
+            return cached
+        
         temp_db_path = None
         usage_data = {}
         
@@ -1534,33 +2286,60 @@ class OllamaModelViewer:
             # Determine which database file to use
             if encrypted_path.exists():
                 print("🔒 Accessing encrypted OpenWebUI database...")
-                temp_db_path = self.decrypt_database_for_access(encrypted_path)
-                if not temp_db_path:
+                db_bytes = self.decrypt_database_for_access(encrypted_path)
+                if db_bytes is None:
                     print("❌ Failed to decrypt database")
                     return {}
-                actual_db_path = temp_db_path
+                if DECRYPT_IN_MEMORY:
+                    # Hand the decrypted bytes straight to SQLite; the plaintext never touches the disk.
+                    # An in-memory database can't be in WAL mode, and OpenWebUI's usually is: header
+                    # bytes 18-19 (file format write/read version) 2 = WAL, 1 = rollback journal
+                    if db_bytes[18:20] == b'\x02\x02':
+                        db_bytes = bytearray(db_bytes)
+                        db_bytes[18:20] = b'\x01\x01'
+                    conn = sqlite3.connect(':memory:', isolation_level=None)
+                    conn.deserialize(db_bytes)
+                else:
+                    # Python < 3.11 has no deserialize(), so go through a temporary file
+                    fd, temp_name = tempfile.mkstemp(suffix='.tmp', prefix='webui-', dir=self.openwebui_data_path)
+                    temp_db_path = Path(temp_name)
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(db_bytes)
+                    conn = sqlite3.connect(f"{temp_db_path.resolve().as_uri()}?mode=ro&immutable=1",
+                                           uri=True, isolation_level=None)
             elif db_path.exists():
-                actual_db_path = db_path
+                # Read-only, no transaction bookkeeping. Not immutable: a local OpenWebUI may be
+                # writing to this database (and its WAL) while we read it
+                conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True, isolation_level=None)
             else:
                 return {}
             
-            # Connect to database and extract usage data
-            conn = sqlite3.connect(str(actual_db_path))
+            # Extract usage data
             cursor = conn.cursor()
             
-            # Query to get model usage from chat table - ONLY usage statistics, no chat content
+            # Read-only access, with the file memory-mapped instead of read through pread
+            cursor.execute("PRAGMA query_only = 1")
+            cursor.execute(f"PRAGMA mmap_size = {USAGE_DB_MMAP_BYTES}")
+            
+            # Query to get model usage from chat table - ONLY usage statistics, no chat content.
+            # Each row's JSON is extracted once in the CTE, then aggregated.
             query = """
+                WITH usage AS (
+                    SELECT 
+                        json_extract(chat, '$.models[0]') as model_name,
+                        updated_at,
+                        COALESCE(json_extract(meta, '$.usage.total_tokens'), 0) as tokens
+                    FROM chat
+                )
                 SELECT 
-                    json_extract(chat, '$.models[0]') as model_name,
+                    model_name,
                     COUNT(*) as usage_count,
-                    MAX(chat.updated_at) as last_used,
-                    MIN(chat.updated_at) as first_used,
-                    SUM(CASE WHEN json_extract(chat.meta, '$.usage') IS NOT NULL 
-                             THEN json_extract(chat.meta, '$.usage.total_tokens') 
-                             ELSE 0 END) as total_tokens
-                FROM chat 
-                WHERE json_extract(chat, '$.models[0]') IS NOT NULL
-                GROUP BY json_extract(chat, '$.models[0]')
+                    MAX(updated_at) as last_used,
+                    MIN(updated_at) as first_used,
+                    SUM(tokens) as total_tokens
+                FROM usage 
+                WHERE model_name IS NOT NULL
+                GROUP BY model_name
                 ORDER BY last_used DESC
             """
             
@@ -1583,85 +2362,147 @@ class OllamaModelViewer:
             
             conn.close()
             print(f"📊 Loaded usage data for {len(usage_data)} models from OpenWebUI (privacy protected)")
+            self.write_usage_cache(cache_key, usage_data)
             
         except Exception as e:
             print(f"⚠️ Error reading OpenWebUI database: {e}")
         
         finally:
-            # Always clean up temporary decrypted database
+            # Always clean up a temporary decrypted database
             if temp_db_path:
                 self.cleanup_temp_database(temp_db_path)
         
         return usage_data
 
+    def read_usage_cache(self, cache_key: str) -> Optional[Dict[str, Dict]]:
+        """Return cached usage data if it was computed from the same database file, else None."""
+        try:
+            with open(self.usage_cache_file, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cache.get('cache_key') != cache_key:
+            return None
+        return cache.get('usage_data')
+    
+    def write_usage_cache(self, cache_key: str, usage_data: Dict[str, Dict]):
+        """Save usage data (statistics only, no chat content) for the next launch.
+        
+        The file is private to the user (0600), like the encrypted database it summarizes.
+        """
+        try:
+            self.usage_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Written under a unique name (mkstemp creates it 0600), then swapped in atomically
+            fd, temp_name = tempfile.mkstemp(suffix='.tmp', dir=self.usage_cache_file.parent)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'cache_key': cache_key, 'usage_data': usage_data}, f)
+                os.replace(temp_name, self.usage_cache_file)
+            except BaseException:
+                os.remove(temp_name)
+                raise
+        except OSError as e:
+            print(f"⚠️ Could not save usage cache: {e}")
+
     def clean_model_name_for_matching(self, model_name: str) -> str:
         """Clean model name for matching between Ollama and OpenWebUI."""
-        # Remove common prefixes that OpenWebUI might add
-        prefixes_to_remove = ['ollama/', 'local/', 'models/']
-        
-        clean_name = model_name.lower().strip()
-        for prefix in prefixes_to_remove:
-            if clean_name.startswith(prefix):
-                clean_name = clean_name[len(prefix):]
-        
-        return clean_name
+        return _clean_name_for(model_name)
 
-    def get_model_usage_info(self, model_name: str) -> Optional[Dict]:
-        """Get usage information for a specific model from OpenWebUI data."""
-        if not hasattr(self, '_usage_data_loaded') or not self._usage_data_loaded:
-            # Load usage data only once
-            self.openwebui_usage_data = self.get_openwebui_usage_data()
+    def load_usage_data(self):
+        """Load usage for all models with one OpenWebUI query, unless already cached.
+        
+        Models never wait for OpenWebUI detection: while it is still running they are
+        built without usage, and merge_usage_data() fills it in once detection is done.
+        """
+        if not self._usage_data_loaded and self._openwebui_detected.is_set():
+            with self._usage_lock:
+                self.openwebui_usage_data = self.get_openwebui_usage_data()
             self._usage_data_loaded = True
+    
+    def merge_usage_data(self):
+        """Read usage on a background thread for models that were shown without it."""
+        if (self._usage_data_loaded or self._usage_merge_running or not self.models_data
+                or not self._openwebui_detected.is_set()):
+            return
+        self._usage_merge_running = True
+        
+        def read_usage():
+            try:
+                with self._usage_lock:
+                    usage_data = self.get_openwebui_usage_data()
+                result_queue.put(usage_data)
+            except Exception as e:
+                print(f"⚠️ Error reading OpenWebUI usage: {e}")
+                result_queue.put({})
         
-        clean_name = self.clean_model_name_for_matching(model_name)
-        return self.openwebui_usage_data.get(clean_name)
+        result_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=read_usage, daemon=True).start()
+        self.root.after(50, self._poll_usage_merge, result_queue)
+    
+    def _poll_usage_merge(self, result_queue: queue.Queue):
+        """Add freshly read usage to the loaded models and redraw them."""
+        try:
+            usage_data = result_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_usage_merge, result_queue)
+            return
+        
+        self._usage_merge_running = False
+        if self._usage_data_loaded:
+            return  # A newer reload already brought its own usage
+        self.openwebui_usage_data = usage_data
+        self._usage_data_loaded = True
+        if not usage_data:
+            return
+        
+        for model in self.models_data:
+            usage_info = self.get_model_usage_info(model['name'])
+            model['usage_info'] = usage_info
+            model['last_used_at'] = self.parse_usage_time(usage_info.get('last_used')) if usage_info else None
+            model['flags'] = self.model_flags(model)
+        self.close_detail_windows()  # Cached details were built without usage
+        self.build_filter_index()
+        if self.filter_var.get() in USAGE_FILTERS:
+            self.apply_filters()
+        else:
+            self.populate_tree()  # Same rows, refreshed status icons
+    
+    def get_model_usage_info(self, model_name: str) -> Optional[Dict]:
+        """Get usage information for a specific model from the loaded OpenWebUI data."""
+        return self.openwebui_usage_data.get(_clean_name_for(model_name))
 
-    def format_last_used_time(self, timestamp: str) -> str:
-        """Format the last used timestamp into a human-readable string."""
+    def format_last_used_time(self, timestamp, now: Optional[datetime.datetime] = None) -> str:
+        """Format the last used timestamp into a human-readable string.
+        
+        Pass now when formatting many timestamps so the clock is read once.
+        """
         if not timestamp:
             return "Never used"
         
-        try:
-            # Parse timestamp (OpenWebUI typically uses Unix timestamp)
-            if isinstance(timestamp, (int, float)):
-                last_used = datetime.datetime.fromtimestamp(timestamp)
-            else:
-                # Try to parse as ISO format or other common formats
-                try:
-                    last_used = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                except:
-                    last_used = datetime.datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-            
-            now = datetime.datetime.now()
-            diff = now - last_used
-            
-            if diff.days == 0:
-                if diff.seconds < 3600:
-                    minutes = diff.seconds // 60
-                    return f"{minutes} minutes ago"
-                else:
-                    hours = diff.seconds // 3600
-                    return f"{hours} hours ago"
-            elif diff.days == 1:
-                return "1 day ago"
-            elif diff.days < 7:
-                return f"{diff.days} days ago"
-            elif diff.days < 30:
-                weeks = diff.days // 7
-                return f"{weeks} week{'s' if weeks > 1 else ''} ago"
-            elif diff.days < 365:
-                months = diff.days // 30
-                return f"{months} month{'s' if months > 1 else ''} ago"
-            else:
-                years = diff.days // 365
-                return f"{years} year{'s' if years > 1 else ''} ago"
-                
-        except Exception as e:
-            print(f"Error parsing timestamp {timestamp}: {e}")
+        # Unix seconds (what OpenWebUI stores) or an ISO string; anything else is unparseable
+        last_used = self.parse_usage_time(timestamp)
+        if last_used is None:
+            print(f"Error parsing timestamp {timestamp!r}")
             return "Unknown"
+        
+        return self.format_time_ago(last_used, now or datetime.datetime.now())
+    
+    def format_time_ago(self, moment: datetime.datetime, now: datetime.datetime) -> str:
+        """Format how long before now a (naive local) datetime was, e.g. '3 weeks ago'."""
+        diff = now - moment
+        
+        if diff.days == 0:
+            if diff.seconds < 3600:
+                return f"{diff.seconds // 60} minutes ago"
+            return f"{diff.seconds // 3600} hours ago"
+        return _days_ago_text(diff.days)
 
     def generate_database_key(self) -> bytes:
-        """Generate a secure key for database encryption."""
+        """Generate a secure key for database encryption.
+        
+        The key only lives in memory (self.database_key) for the session; writing it
+        next to the encrypted database would defeat the encryption.
+        """
         # Use a combination of user-specific data for key generation
         # Use machine-specific data that doesn't expose username
         home_path = str(Path.home())
@@ -1669,7 +2510,7 @@ class OllamaModelViewer:
         machine_id = hashlib.sha256(home_path.encode()).hexdigest()[:16]
         key_material = f"ollama_viewer_{machine_id}"
         key = hashlib.pbkdf2_hmac('sha256', key_material.encode(), b'ollama_viewer_salt_v1', 100000)
-        return base64.b64encode(key)[:32]  # 32 bytes for encryption
+        return key  # Raw 32-byte key for AES-256
 
     def encrypt_database_file(self, db_path: Path) -> bool:
         """Encrypt the database file for privacy protection."""
@@ -1677,22 +2518,22 @@ class OllamaModelViewer:
             return True
             
         try:
-            # For now, implement basic obfuscation
-            # In production, would use proper encryption like Fernet
-            encrypted_path = db_path.with_suffix('.enc')
-            
-            with open(db_path, 'rb') as f:
-                data = f.read()
+            # webui.db -> webui.db.enc, the name get_openwebui_usage_data looks for
+            encrypted_path = db_path.with_name(db_path.name + '.enc')
             
-            # Simple XOR encryption (for demo - would use proper crypto in production)
             if not self.database_key:
                 self.database_key = self.generate_database_key()
             
-            key_bytes = self.database_key
-            encrypted_data = bytes(a ^ b for a, b in zip(data, (key_bytes * (len(data) // len(key_bytes) + 1))[:len(data)]))
+            if Cipher is None:
+                # XOR with a key derived from the home path is obfuscation, not encryption
+                print(f"⚠️ cryptography is not installed: the OpenWebUI database copy is NOT encrypted ({db_path})")
+                print("💡 Install it with: pip install cryptography")
+                if encrypted_path.exists():
+                    os.remove(encrypted_path)  # Don't let an older encrypted copy shadow the fresh one
+                return False
             
-            with open(encrypted_path, 'wb') as f:
-                f.write(encrypted_data)
+            with open(db_path, 'rb') as src, open(encrypted_path, 'wb') as dst:
+                _aes_ctr_stream(src, dst, self.database_key)
             
             # Remove original unencrypted file
             os.remove(db_path)
@@ -1703,27 +2544,30 @@ class OllamaModelViewer:
             print(f"⚠️ Failed to encrypt database: {e}")
             return False
 
-    def decrypt_database_for_access(self, encrypted_path: Path) -> Optional[Path]:
-        """Temporarily decrypt database for read-only access."""
+    def decrypt_database_for_access(self, encrypted_path: Path) -> Optional[bytes]:
+        """Decrypt the database into memory for read-only access."""
         if not self.encrypt_database:
-            return encrypted_path
+            return encrypted_path.read_bytes()
             
         try:
-            temp_db_path = encrypted_path.with_suffix('.tmp')
-            
-            with open(encrypted_path, 'rb') as f:
-                encrypted_data = f.read()
-            
             if not self.database_key:
                 self.database_key = self.generate_database_key()
             
-            key_bytes = self.database_key
-            decrypted_data = bytes(a ^ b for a, b in zip(encrypted_data, (key_bytes * (len(encrypted_data) // len(key_bytes) + 1))[:len(encrypted_data)]))
-            
-            with open(temp_db_path, 'wb') as f:
-                f.write(decrypted_data)
+            decrypted = io.BytesIO()
+            with open(encrypted_path, 'rb') as src:
+                is_aes = src.read(len(DB_AES_MAGIC)) == DB_AES_MAGIC
+                src.seek(0)
+                
+                if is_aes:
+                    if Cipher is None:
+                        print("⚠️ Database is AES encrypted but the cryptography package is not installed")
+                        return None
+                    _aes_ctr_stream(src, decrypted, self.database_key, decrypt=True)
+                else:
+                    # XOR-obfuscated copy written by older versions
+                    _xor_stream(src, decrypted, self.database_key)
             
-            return temp_db_path
+            return decrypted.getvalue()
             
         except Exception as e:
             print(f"⚠️ Failed to decrypt database: {e}")
@@ -1733,9 +2577,11 @@ class OllamaModelViewer:
         """Securely clean up temporary decrypted database."""
         if temp_db_path and temp_db_path.exists() and temp_db_path.suffix == '.tmp':
             try:
-                # Overwrite file before deletion for security
-                with open(temp_db_path, 'wb') as f:
-                    f.write(os.urandom(temp_db_path.stat().st_size))
+                # Zero the SQLite header before deletion so the file is no longer readable as a database;
+                # a full overwrite doesn't reach the original blocks on copy-on-write/journaling filesystems
+                size = temp_db_path.stat().st_size
+                with open(temp_db_path, 'r+b') as f:
+                    f.write(b"\x00" * min(TEMP_DB_WIPE_BYTES, size))
                 os.remove(temp_db_path)
             except Exception as e:
                 print(f"⚠️ Failed to securely clean up temp database: {e}")
@@ -1754,15 +2600,17 @@ class OllamaModelViewer:
         # Header
         header_label = ttk.Label(privacy_window,
                                 text="🔒 Privacy Protection Enabled",
-                                font=('SF Pro Display', 18, 'bold'),
+                                font=FONT_TITLE,
                                 foreground=self.colors['accent_green'])
         header_label.pack(pady=20)
         
         # Privacy info
-        info_text = """
+        encryption_line = ("✅ Database encryption (AES-256) is ENABLED by default" if Cipher is not None
+                           else "⚠️ Database encryption is UNAVAILABLE - install the cryptography package")
+        info_text = f"""
 🛡️ Your OpenWebUI chat data is being protected:
 
-✅ Database encryption is ENABLED by default
+{encryption_line}
 ✅ Only usage statistics are accessed (no chat content)
 ✅ All data processing happens locally on your machine
 ✅ No data is transmitted to external services
@@ -1780,7 +2628,7 @@ These features would require additional privacy controls and explicit user conse
                              text=info_text,
                              bg=self.colors['bg_primary'],
                              fg=self.colors['text_primary'],
-                             font=('SF Pro Display', 11),
+                             font=FONT_BODY,
                              justify='left')
         info_label.pack(padx=20, pady=10, fill='both', expand=True)
         
@@ -1802,7 +2650,7 @@ These features would require additional privacy controls and explicit user conse
                               command=accept_settings,
                               bg=self.colors['accent_green'],
                               fg=self.colors['bg_primary'],
-                              font=('SF Pro Display', 12, 'bold'),
+                              font=FONT_MEDIUM_BOLD,
                               padx=20, pady=8)
         accept_btn.pack(side='right', padx=(10, 0))
         
@@ -1811,10 +2659,11 @@ These features would require additional privacy controls and explicit user conse
                                command=disable_openwebui,
                                bg=self.colors['accent_red'],
                                fg='white',
-                               font=('SF Pro Display', 11),
+                               font=FONT_BODY,
                                padx=20, pady=8)
         disable_btn.pack(side='right')
 
+
 def main():
     """Main function to run the application."""
     # Set up virtual environment with required packages
@@ -1822,6 +2671,7 @@ def main():
         custom_name="venv-ollama-model-viewer",
         auto_packages=[
             # tkinter is built into Python, no need to install
+            'cryptography',  # AES encryption of the copied OpenWebUI database
         ]
     )
     
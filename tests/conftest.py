@@ -0,0 +1,34 @@
+"""Shared fixtures: OllamaModelViewer instances without a Tk window."""
+
+import os
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.append(os.path.expanduser('~/py-utils'))
+try:
+    import module_venv  # noqa: F401
+except ImportError:
+    # The venv bootstrapper from ~/py-utils is only used by main(), which tests never call
+    sys.modules['module_venv'] = types.SimpleNamespace(AutoVirtualEnvironment=None)
+
+import ollama_model_viewer as omv  # noqa: E402
+
+
+@pytest.fixture
+def viewer(tmp_path):
+    """A viewer with the OpenWebUI state __init__ sets up, but no UI."""
+    viewer = object.__new__(omv.OllamaModelViewer)
+    viewer.openwebui_data_path = None
+    viewer.openwebui_usage_data = {}
+    viewer._usage_data_loaded = False
+    viewer._usage_lock = threading.Lock()
+    viewer.usage_cache_file = tmp_path / 'cache' / 'usage.json'
+    viewer._openwebui_source_hash = None
+    viewer.encrypt_database = True
+    viewer.database_key = None
+    return viewer
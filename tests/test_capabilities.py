@@ -0,0 +1,35 @@
+"""Capability detection from model names."""
+
+import pytest
+
+import ollama_model_viewer as omv
+
+
+@pytest.mark.parametrize('name', [
+    'llava:13b', 'bakllava:7b', 'llama3.2-vision:11b', 'qwen2.5vl:7b', 'qwen2.5-vl:72b',
+    'internvl:8b', 'internvl2.5:4b', 'cogvlm2:19b', 'smolvlm:2b', 'minicpm-v:8b', 'minicpm-v2.6:8b',
+])
+def test_vision_models(name):
+    assert omv._capabilities_for(name)[1] & omv.CAP_VISION
+
+
+@pytest.mark.parametrize('name', ['devlin:7b', 'llama3:8b', 'mistral-nemo:12b', 'minicpm:2b'])
+def test_not_vision_models(name):
+    assert not omv._capabilities_for(name)[1] & omv.CAP_VISION
+
+
+@pytest.mark.parametrize('name, flag', [
+    ('qwen2.5-coder:7b', omv.CAP_CODE),
+    ('nomic-embed-text:latest', omv.CAP_EMBED),
+    ('deepseek-r1:8b', omv.CAP_REASONING),
+])
+def test_other_capabilities(name, flag):
+    assert omv._capabilities_for(name)[1] & flag
+
+
+@pytest.mark.parametrize('name, flag', [
+    ('t5-decoder:base', omv.CAP_CODE),
+    ('fr10:7b', omv.CAP_REASONING),
+])
+def test_guarded_keywords(name, flag):
+    assert not omv._capabilities_for(name)[1] & flag
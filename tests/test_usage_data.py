@@ -0,0 +1,126 @@
+"""OpenWebUI usage extraction from plain and encrypted webui.db copies."""
+
+import json
+import sqlite3
+import stat
+import threading
+
+import pytest
+
+import ollama_model_viewer as omv
+
+needs_cryptography = pytest.mark.skipif(omv.Cipher is None, reason="cryptography is not installed")
+
+
+def make_webui_db(path, journal_mode):
+    """Write a minimal OpenWebUI chat table, checkpointed so the main file holds every row."""
+    conn = sqlite3.connect(path)
+    conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+    conn.execute("CREATE TABLE chat (chat TEXT, meta TEXT, updated_at INTEGER)")
+    rows = [('llama3:8b', 1700000000), ('llama3:8b', 1700000100), ('ollama/llava:13b', 1700000050)]
+    for model, updated_at in rows:
+        conn.execute("INSERT INTO chat VALUES (?, ?, ?)",
+                     (json.dumps({'models': [model]}), json.dumps({'usage': {'total_tokens': 10}}), updated_at))
+    conn.commit()
+    if journal_mode == 'wal':
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+
+
+@pytest.mark.parametrize('journal_mode', ['delete', 'wal'])
+@pytest.mark.parametrize('encrypted', [False, pytest.param(True, marks=needs_cryptography)])
+def test_usage_counts(viewer, tmp_path, journal_mode, encrypted):
+    db_path = tmp_path / 'webui.db'
+    make_webui_db(db_path, journal_mode)
+    viewer.openwebui_data_path = tmp_path
+    if journal_mode == 'wal':
+        assert db_path.read_bytes()[18:20] == b'\x02\x02'  # WAL file format versions
+    if encrypted:
+        assert viewer.encrypt_database_file(db_path)
+        assert not db_path.exists()
+    
+    usage = viewer.get_openwebui_usage_data()
+    
+    assert usage['llama3:8b']['usage_count'] == 2
+    assert usage['llama3:8b']['last_used'] == 1700000100
+    assert usage['llama3:8b']['total_tokens'] == 20
+    assert usage['llava:13b']['usage_count'] == 1
+    assert usage['llava:13b']['original_name'] == 'ollama/llava:13b'
+
+
+
+def test_no_encryption_without_cryptography(viewer, tmp_path, monkeypatch):
+    monkeypatch.setattr(omv, 'Cipher', None)
+    db_path = tmp_path / 'webui.db'
+    make_webui_db(db_path, 'wal')
+    (tmp_path / 'webui.db.enc').write_bytes(b'stale')
+    viewer.openwebui_data_path = tmp_path
+    
+    assert not viewer.encrypt_database_file(db_path)
+    assert db_path.exists() and not (tmp_path / 'webui.db.enc').exists()
+    assert viewer.get_openwebui_usage_data()['llama3:8b']['usage_count'] == 2
+
+
+def test_reads_xor_copies_from_older_versions(viewer, tmp_path):
+    db_path = tmp_path / 'webui.db'
+    make_webui_db(db_path, 'delete')
+    viewer.database_key = viewer.generate_database_key()
+    with open(db_path, 'rb') as src, open(tmp_path / 'webui.db.enc', 'wb') as dst:
+        omv._xor_stream(src, dst, viewer.database_key)
+    db_path.unlink()
+    viewer.openwebui_data_path = tmp_path
+    
+    assert viewer.get_openwebui_usage_data()['llava:13b']['usage_count'] == 1
+
+
+@needs_cryptography
+def test_temp_file_fallback_is_unique_and_removed(viewer, tmp_path, monkeypatch):
+    monkeypatch.setattr(omv, 'DECRYPT_IN_MEMORY', False)
+    db_path = tmp_path / 'webui.db'
+    make_webui_db(db_path, 'wal')
+    viewer.openwebui_data_path = tmp_path
+    assert viewer.encrypt_database_file(db_path)
+    
+    assert viewer.get_openwebui_usage_data()['llama3:8b']['usage_count'] == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['cache', 'webui.db.enc']
+
+
+def test_usage_cache_is_private_and_reused(viewer, tmp_path, monkeypatch):
+    make_webui_db(tmp_path / 'webui.db', 'delete')
+    viewer.openwebui_data_path = tmp_path
+    first = viewer.get_openwebui_usage_data()
+    
+    assert stat.S_IMODE(viewer.usage_cache_file.stat().st_mode) == 0o600
+    assert [path.name for path in viewer.usage_cache_file.parent.iterdir()] == ['usage.json']
+    monkeypatch.setattr(omv.sqlite3, 'connect', None)  # A cache hit never opens the database
+    assert viewer.get_openwebui_usage_data() == first
+
+
+def test_overlapping_loads_read_usage_once_each(viewer, tmp_path):
+    make_webui_db(tmp_path / 'webui.db', 'wal')
+    viewer.openwebui_data_path = tmp_path
+    viewer._openwebui_detected = threading.Event()
+    viewer._openwebui_detected.set()
+    active, peak = [], []
+    read_usage = viewer.get_openwebui_usage_data
+    
+    def tracked_read():
+        active.append(1)
+        peak.append(len(active))
+        try:
+            return read_usage()
+        finally:
+            active.pop()
+    viewer.get_openwebui_usage_data = tracked_read
+    
+    def reload():
+        viewer._usage_data_loaded = False
+        viewer.load_usage_data()
+    threads = [threading.Thread(target=reload) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert max(peak) == 1
+    assert viewer.openwebui_usage_data['llama3:8b']['usage_count'] == 2